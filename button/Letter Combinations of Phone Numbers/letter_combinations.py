@@ -1,15 +1,523 @@
+import argparse
+import multiprocessing
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import time
 import tkinter as tk
 from tkinter import ttk
-from itertools import product
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product, islice
+from math import prod
+from random import sample
+import numpy as np
+
+
+def read_words(path):
+    # One word per line, only words made of keypad letters are kept
+    letters = set(''.join(PhoneKeypadApp.digit_map.values()))
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            word = line.strip().lower()
+            if word and set(word) <= letters:
+                yield word
+
+
+class T9Dictionary:
+    # Letter trie of a word list: every node is a dict of letter -> child node,
+    # the '' key marks the end of a word
+    end = ''
+
+    def __init__(self, words=()):
+        self.root = {}
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        if self.end not in node:
+            node[self.end] = True
+            self.size += 1
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(read_words(path))
+
+    @classmethod
+    def load(cls, path, cache_path=None):
+        # Build the trie once and keep it pickled next to the word list,
+        # the cache is rebuilt when the word list is newer than it.
+        # Only plain dicts are pickled, so the cache does not depend on the module name
+        cache_path = cache_path or path + '.trie.pickle'
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            dictionary = cls()
+            with open(cache_path, 'rb') as file:
+                dictionary.root, dictionary.size = pickle.load(file)
+            return dictionary
+
+        dictionary = cls.from_file(path)
+        with open(cache_path, 'wb') as file:
+            pickle.dump((dictionary.root, dictionary.size), file, protocol=pickle.HIGHEST_PROTOCOL)
+        return dictionary
+
+    def start(self):
+        # Frontier of the empty digit sequence: (prefix, node) pairs still alive
+        return [('', self.root)]
+
+    def step(self, frontier, letters):
+        # Extend the frontier by one digit, a branch is dropped as soon as its
+        # prefix is not the start of any word
+        return [(prefix + char, node[char]) for prefix, node in frontier
+                for char in letters if char in node]
+
+    def walk(self, letters_list):
+        # Follow the digit sequence through the trie
+        frontier = self.start()
+        for letters in letters_list:
+            frontier = self.step(frontier, letters)
+            if not frontier:
+                break
+        return frontier
+
+    def words(self, letters_list):
+        # Real words that spell exactly the selected digits
+        return self.frontier_words(self.walk(letters_list))
+
+    def completions(self, letters_list, limit=None):
+        # Longer words that start with one of the matched prefixes
+        return list(islice(self.iter_completions(self.walk(letters_list)), limit))
+
+    def frontier_words(self, frontier):
+        return [prefix for prefix, node in frontier if self.end in node]
+
+    def iter_completions(self, frontier):
+        for prefix, node in frontier:
+            stack = [(prefix + char, child) for char, child in reversed(node.items()) if char != self.end]
+            while stack:
+                word, node = stack.pop()
+                if self.end in node:
+                    yield word
+                stack.extend((word + char, child) for char, child in reversed(node.items()) if char != self.end)
+
+
+class DigitIndex:
+    # Inverse of digit_map: digit key -> words typed with exactly those keys.
+    # Words of one key are stored as a single newline-joined string, which keeps
+    # millions of words at one string object per key instead of one per word
+    separator = '\n'
+
+    def __init__(self, keys=None):
+        self.keys = keys or {}
+
+    @staticmethod
+    def translation_table():
+        return str.maketrans({char: digit for digit, letters in PhoneKeypadApp.digit_map.items()
+                              for char in letters})
+
+    @classmethod
+    def encode(cls, words):
+        # Bulk encoding: one translate() call over the joined words instead of a
+        # lookup per letter
+        words = list(words)
+        return cls.separator.join(words).translate(cls.translation_table()).split(cls.separator), words
+
+    @classmethod
+    def from_words(cls, words):
+        digits, words = cls.encode(words)
+        groups = {}
+        for key, word in zip(digits, words):
+            groups.setdefault(key, []).append(word)
+        return cls({key: cls.separator.join(group) for key, group in groups.items()})
+
+    @classmethod
+    def from_file(cls, path):
+        return cls.from_words(read_words(path))
+
+    @classmethod
+    def load(cls, path, cache_path=None):
+        # Same cache rules as T9Dictionary.load
+        cache_path = cache_path or path + '.digits.pickle'
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, 'rb') as file:
+                return cls(pickle.load(file))
+
+        index = cls.from_file(path)
+        with open(cache_path, 'wb') as file:
+            pickle.dump(index.keys, file, protocol=pickle.HIGHEST_PROTOCOL)
+        return index
+
+    def lookup(self, digits):
+        # "Which words match 2273?" is a single dict lookup
+        words = self.keys.get(str(digits))
+        return words.split(self.separator) if words else []
+
+    def __len__(self):
+        return len(self.keys)
+
+
+def combination_chunks(letters_list, chunk_size=1 << 20, start=0, stop=None):
+    # Yield the combinations with ranks in [start, stop) in product() order as
+    # (n, width) uint8 arrays of at most chunk_size rows. Each chunk is a
+    # vectorized unrank of a range of indexes: one divmod and one table lookup
+    # per letter position
+    tables = [np.frombuffer(letters.encode('ascii'), dtype=np.uint8) for letters in letters_list]
+    width = len(tables)
+    total = prod(len(table) for table in tables)
+    stop = total if stop is None else min(stop, total)
+
+    for start in range(start, stop, chunk_size):
+        index = np.arange(start, min(start + chunk_size, stop), dtype=np.int64)
+        chunk = np.empty((len(index), width), dtype=np.uint8)
+        for pos in range(width - 1, -1, -1):
+            index, letter = np.divmod(index, len(tables[pos]))
+            chunk[:, pos] = tables[pos][letter]
+        yield chunk
+
+
+def chunk_lines(chunk):
+    # Newline-delimited bytes of a chunk
+    lines = np.empty((len(chunk), chunk.shape[1] + 1), dtype=np.uint8)
+    lines[:, :-1] = chunk
+    lines[:, -1] = ord('\n')
+    return lines.tobytes()
+
+
+def export_combinations(digits, path, chunk_size=1 << 20):
+    # Write every combination of the digits to path: a raw .npy array of
+    # fixed-width byte strings, or a newline-delimited text file otherwise.
+    # Returns the throughput of the run
+    letters_list = [PhoneKeypadApp.digit_map[digit] for digit in str(digits)]
+    width = len(letters_list)
+    total = prod(len(letters) for letters in letters_list)
+
+    started = time.perf_counter()
+    if path.endswith('.npy'):
+        output = np.lib.format.open_memmap(path, mode='w+', dtype=f'S{width}', shape=(total,))
+        start = 0
+        for chunk in combination_chunks(letters_list, chunk_size):
+            output[start:start + len(chunk)] = chunk.view(f'S{width}').ravel()
+            start += len(chunk)
+        output.flush()
+        del output
+    else:
+        with open(path, 'wb') as file:
+            for chunk in combination_chunks(letters_list, chunk_size):
+                file.write(chunk_lines(chunk))
+    seconds = time.perf_counter() - started
+
+    return {
+        'count': total,
+        'bytes': os.path.getsize(path),
+        'seconds': seconds,
+        'per_second': total / seconds if seconds else float('inf'),
+    }
+
+
+# Set in every pool worker by ShardedEnumeration, checked between chunks
+shard_cancel_event = None
+
+
+def init_shard_worker(cancel_event):
+    global shard_cancel_event
+    shard_cancel_event = cancel_event
+
+
+def enumerate_shard(letters_list, start, stop, path=None, pattern=None, hit_limit=None, chunk_size=1 << 16):
+    # Enumerate the ranks [start, stop) in a pool worker. Combinations (or only
+    # the ones matching pattern) are streamed to path when given, matches are
+    # also returned up to hit_limit
+    regex = re.compile(pattern) if pattern else None
+    result = {'start': start, 'stop': stop, 'count': 0, 'matches': 0, 'hits': [],
+              'path': path, 'cancelled': False}
+    file = open(path, 'wb') if path else None
+    try:
+        for chunk in combination_chunks(letters_list, chunk_size, start, stop):
+            if shard_cancel_event is not None and shard_cancel_event.is_set():
+                result['cancelled'] = True
+                break
+            result['count'] += len(chunk)
+            lines = chunk_lines(chunk)
+            if regex is None:
+                if file:
+                    file.write(lines)
+                continue
+
+            words = [word for word in lines.decode('ascii').split('\n')[:-1] if regex.search(word)]
+            result['matches'] += len(words)
+            if file and words:
+                file.write(('\n'.join(words) + '\n').encode('ascii'))
+            if hit_limit is None or len(result['hits']) < hit_limit:
+                result['hits'].extend(words[:None if hit_limit is None else hit_limit - len(result['hits'])])
+    finally:
+        if file:
+            file.close()
+    return result
+
+
+class ShardedEnumeration:
+    # Splits the product space into rank ranges and enumerates them on a
+    # ProcessPoolExecutor. Results are always merged in rank order, so the
+    # output does not depend on which worker finishes first
+    def __init__(self, letters_list, workers=None, shards=None, output_dir=None, pattern=None, hit_limit=None):
+        self.letters_list = list(letters_list)
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers * 4
+        self.output_dir = output_dir
+        self.pattern = pattern
+        self.hit_limit = hit_limit
+        self.total = prod(len(letters) for letters in self.letters_list)
+        self.cancel_event = multiprocessing.Event()
+        self.executor = None
+        self.futures = []
+
+    def ranges(self):
+        step = -(-self.total // self.shards) or 1
+        return [(start, min(start + step, self.total)) for start in range(0, self.total, step)]
+
+    def start(self):
+        self.executor = ProcessPoolExecutor(self.workers, initializer=init_shard_worker,
+                                            initargs=(self.cancel_event,))
+        for number, (start, stop) in enumerate(self.ranges()):
+            path = os.path.join(self.output_dir, f"shard-{number:05d}.txt") if self.output_dir else None
+            self.futures.append(self.executor.submit(enumerate_shard, self.letters_list, start, stop,
+                                                     path, self.pattern, self.hit_limit))
+        self.executor.shutdown(wait=False)
+        return self
+
+    def cancel(self):
+        # Pending shards are dropped, running ones stop at their next chunk
+        self.cancel_event.set()
+        for future in self.futures:
+            future.cancel()
+
+    def progress(self):
+        return sum(future.done() for future in self.futures), len(self.futures)
+
+    def done(self):
+        return all(future.done() for future in self.futures)
+
+    def results(self):
+        # Shard results in rank order, cancelled shards are left out
+        return [future.result() for future in self.futures if not future.cancelled()]
+
+    def hits(self):
+        return [word for result in self.results() for word in result['hits']]
+
+    def merge(self, path):
+        # Concatenate the shard files in rank order
+        with open(path, 'wb') as output:
+            for result in self.results():
+                with open(result['path'], 'rb') as file:
+                    shutil.copyfileobj(file, output)
+
+
+class CombinationFilter:
+    # Constraints applied while the combinations are built depth first, so a
+    # branch is dropped as soon as its prefix cannot lead to a match:
+    #   glob      - fnmatch-style pattern (*, ?, [abc], [!abc]) over the whole word
+    #   pattern   - regex the whole word must match, checked on complete words
+    #               only since re has no partial matching
+    #   required  - letters that must all appear
+    #   forbidden - letters that must not appear
+    #   unique    - no letter may be used twice
+    # pruned counts the dropped branches by reason
+    def __init__(self, glob=None, pattern=None, required='', forbidden='', unique=False):
+        self.tokens = self.parse_glob(glob) if glob else None
+        self.regex = re.compile(pattern) if pattern else None
+        self.required = set(required)
+        self.forbidden = set(forbidden)
+        self.unique = unique
+        self.pruned = Counter()
+        self.visited = 0
+
+    @staticmethod
+    def parse_glob(glob):
+        # Tokens are '*' or the set of letters one position accepts; None
+        # accepts any letter and a (letters, True) pair is a negated set
+        tokens = []
+        pos = 0
+        while pos < len(glob):
+            char = glob[pos]
+            if char == '[' and ']' in glob[pos + 2:]:
+                end = glob.index(']', pos + 2)
+                letters = glob[pos + 1:end]
+                negate = letters.startswith('!')
+                tokens.append((set(letters[1:] if negate else letters), negate))
+                pos = end + 1
+                continue
+            if char == '*':
+                if not tokens or tokens[-1] != '*':
+                    tokens.append('*')
+            elif char == '?':
+                tokens.append(None)
+            else:
+                tokens.append(({char}, False))
+            pos += 1
+        return tokens
+
+    def glob_closure(self, states):
+        # A '*' also matches nothing, so its state implies the next one
+        states = set(states)
+        for state in sorted(states):
+            while state < len(self.tokens) and self.tokens[state] == '*':
+                state += 1
+                states.add(state)
+        return frozenset(states)
+
+    def glob_step(self, states, char):
+        moved = set()
+        for state in states:
+            if state == len(self.tokens):
+                continue
+            token = self.tokens[state]
+            if token == '*':
+                moved.add(state)
+            elif token is None or (char in token[0]) != token[1]:
+                moved.add(state + 1)
+        return self.glob_closure(moved)
+
+    def glob_viable(self, states, remaining):
+        # Some state can still be finished with exactly `remaining` more letters
+        for state in states:
+            rest = self.tokens[state:]
+            needed = sum(token != '*' for token in rest)
+            if needed == remaining or (needed < remaining and '*' in rest):
+                return True
+        return False
+
+    def combinations(self, letters_list):
+        # Letters still reachable from every depth, for the required check
+        reachable = [set() for _ in range(len(letters_list) + 1)]
+        for depth in range(len(letters_list) - 1, -1, -1):
+            reachable[depth] = reachable[depth + 1] | (set(letters_list[depth]) - self.forbidden)
+
+        states = self.glob_closure({0}) if self.tokens is not None else None
+        yield from self.build(letters_list, reachable, 0, '', states)
+
+    def build(self, letters_list, reachable, depth, prefix, states):
+        self.visited += 1
+        missing = self.required.difference(prefix)
+        if not missing <= reachable[depth] or len(missing) > len(letters_list) - depth:
+            self.pruned['required'] += 1
+            return
+        if states is not None and not self.glob_viable(states, len(letters_list) - depth):
+            self.pruned['glob'] += 1
+            return
+
+        if depth == len(letters_list):
+            if self.regex is not None and not self.regex.fullmatch(prefix):
+                self.pruned['pattern'] += 1
+                return
+            yield prefix
+            return
+
+        for char in letters_list[depth]:
+            if char in self.forbidden:
+                self.pruned['forbidden'] += 1
+                continue
+            if self.unique and char in prefix:
+                self.pruned['unique'] += 1
+                continue
+            next_states = self.glob_step(states, char) if states is not None else None
+            yield from self.build(letters_list, reachable, depth + 1, prefix + char, next_states)
+
+
+class PrefixCache:
+    # Results of a digit sequence built one digit at a time from the result of
+    # its prefix. The prefixes of the current sequence are kept on a stack, so
+    # pressing a digit extends the top and un-toggling one rolls back to the
+    # last shared ancestor. Recent sequences are also kept in a bounded LRU,
+    # so retyping a sequence costs nothing
+    def __init__(self, initial, extend, maxsize=128):
+        self.initial = initial
+        self.extend = extend
+        self.maxsize = maxsize
+        self.stack = []
+        self.recent = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digits):
+        digits = tuple(digits)
+
+        # Roll back to the longest prefix shared with the current sequence
+        shared = 0
+        while shared < min(len(self.stack), len(digits)) and self.stack[shared][0] == digits[:shared + 1]:
+            shared += 1
+        del self.stack[shared:]
+
+        state = self.stack[-1][1] if self.stack else self.initial
+        for end in range(shared + 1, len(digits) + 1):
+            key = digits[:end]
+            if key in self.recent:
+                self.recent.move_to_end(key)
+                self.hits += 1
+                state = self.recent[key]
+            else:
+                self.misses += 1
+                state = self.extend(state, digits[end - 1])
+                self.recent[key] = state
+                if len(self.recent) > self.maxsize:
+                    self.recent.popitem(last=False)
+            self.stack.append((key, state))
+        return state
+
+    def clear(self):
+        self.stack = []
+        self.recent.clear()
+
 
 class PhoneKeypadApp:
-    def __init__(self, root):
+    digit_map = {
+        '2': 'abc',
+        '3': 'def',
+        '4': 'ghi',
+        '5': 'jkl',
+        '6': 'mno',
+        '7': 'pqrs',
+        '8': 'tuv',
+        '9': 'wxyz'
+    }
+
+    # Number of combinations shown on one result page
+    page_size = 20
+
+    # Number of prefix completions listed after the exact words
+    completion_limit = 200
+
+    # Number of regex matches kept per shard by "Search all"
+    search_hit_limit = 1000
+
+    def __init__(self, root, dictionary=None, digit_index=None):
         self.root = root
+        self.dictionary = dictionary
+        self.digit_index = digit_index
         self.root.title("Phone Keypad Word Combinations")
 
         # Dictionary to store selected letters for each button
         self.selected_letters = {}
 
+        # Letters of the last generated digits and the page currently shown
+        self.result_letters = []
+        self.result_digits = ''
+        self.result_total = 0
+        self.result_words = None
+        self.page = 0
+
+        # Background "Search all" job, if one is running
+        self.search = None
+
+        # Letters, count and trie frontier of every digit prefix, extended as
+        # digits are pressed instead of rebuilt
+        initial = ([], 1, dictionary.start() if dictionary is not None else None)
+        self.prefix_cache = PrefixCache(initial, self.extend_prefix)
+
         # Create a style for the buttons
         style = ttk.Style()
         style.configure("Calculator.TButton", font=('Helvetica', 14), padding=5)
@@ -26,13 +534,64 @@ class PhoneKeypadApp:
             root.grid_rowconfigure(i, weight=1)
 
         # Result label
-        self.result_label = tk.Label(root, text="Result: ")
+        self.result_label = tk.Label(root, text="Result: ", wraplength=400, justify="left")
         self.result_label.grid(row=3, column=0, columnspan=3, pady=10)
 
         # Generate Words button
         self.generate_button = ttk.Button(root, text="Generate Words", style="Calculator.TButton",
                                           command=self.generate_words)
-        self.generate_button.grid(row=4, column=0, columnspan=3, pady=10)
+        self.generate_button.grid(row=4, column=0, columnspan=2, pady=10)
+
+        # Clear button, unselects every digit
+        self.clear_button = ttk.Button(root, text="Clear", style="Calculator.TButton",
+                                       command=self.clear_digits)
+        self.clear_button.grid(row=4, column=2, pady=10)
+
+        # Page navigation: previous / next page and jump to a page number
+        self.page_frame = tk.Frame(root)
+        self.page_frame.grid(row=5, column=0, columnspan=3, pady=10)
+
+        self.prev_button = ttk.Button(self.page_frame, text="<", width=3,
+                                      command=lambda: self.show_page(self.page - 1))
+        self.prev_button.pack(side=tk.LEFT, padx=5)
+
+        self.page_label = tk.Label(self.page_frame, text="Page 0 / 0")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+
+        self.next_button = ttk.Button(self.page_frame, text=">", width=3,
+                                      command=lambda: self.show_page(self.page + 1))
+        self.next_button.pack(side=tk.LEFT, padx=5)
+
+        self.page_entry = tk.Entry(self.page_frame, width=8)
+        self.page_entry.pack(side=tk.LEFT, padx=5)
+        self.page_entry.bind("<Return>", lambda event: self.jump_to_page())
+
+        self.jump_button = ttk.Button(self.page_frame, text="Go", command=self.jump_to_page)
+        self.jump_button.pack(side=tk.LEFT, padx=5)
+
+        self.random_button = ttk.Button(self.page_frame, text="Random", command=self.show_random)
+        self.random_button.pack(side=tk.LEFT, padx=5)
+
+        # Optional word-list mode, only real words from the dictionary are listed
+        self.words_only = tk.BooleanVar(value=dictionary is not None)
+        if dictionary is not None:
+            self.words_button = ttk.Checkbutton(root, text=f"Words only ({dictionary.size} words)",
+                                                variable=self.words_only, command=self.generate_words)
+            self.words_button.grid(row=6, column=0, columnspan=3, pady=5)
+
+        # Regex search over all combinations of the last generated digits,
+        # enumerated on a process pool
+        self.search_frame = tk.Frame(root)
+        self.search_frame.grid(row=7, column=0, columnspan=3, pady=10)
+
+        self.search_entry = tk.Entry(self.search_frame, width=20)
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+
+        self.search_button = ttk.Button(self.search_frame, text="Search all", command=self.start_search)
+        self.search_button.pack(side=tk.LEFT, padx=5)
+
+        self.cancel_button = ttk.Button(self.search_frame, text="Cancel", command=self.cancel_search)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
 
     def toggle_button(self, digit):
         # Toggle the button's state (selected or not selected)
@@ -41,38 +600,247 @@ class PhoneKeypadApp:
         else:
             del self.selected_letters[digit]
 
+        # The result follows the selection, each press only extends (or rolls
+        # back) the cached prefix result
+        self.generate_words()
+
+    def clear_digits(self):
+        self.selected_letters = {}
+        self.generate_words()
+
+    def extend_prefix(self, state, digit):
+        letters_list, total, frontier = state
+        letters = self.selected_letters.get(digit) or self.digit_map[str(digit)]
+        if frontier is not None:
+            frontier = self.dictionary.step(frontier, letters)
+        return letters_list + [letters], total * len(letters), frontier
+
     def generate_words(self):
+        # A running search belongs to the previous letters, its hits must not
+        # replace the new results
+        self.cancel_search()
+
         # Get the digits for which buttons are clicked
         selected_digits = list(self.selected_letters.keys())
 
         if selected_digits:
-            result = self.letter_combinations(selected_digits)
-            self.result_label.config(text=f"Result: {result}")
+            # Only the letters are kept, the combinations are built page by page
+            self.result_letters, self.result_total, frontier = self.prefix_cache.get(selected_digits)
+            self.result_digits = ''.join(str(digit) for digit in selected_digits)
+            self.result_words = None
+            if self.words_only.get():
+                completions = islice(self.dictionary.iter_completions(frontier), self.completion_limit)
+                self.result_words = self.exact_words(frontier) + list(completions)
+                self.result_total = len(self.result_words)
+            self.show_page(0)
         else:
+            self.result_letters = []
+            self.result_total = 0
+            self.result_words = None
+            self.page = 0
+            self.page_label.config(text="Page 0 / 0")
             self.result_label.config(text="Please select at least one digit.")
 
-        # Reset selected letters after generating words
-        self.selected_letters = {}
+    def exact_words(self, frontier):
+        # The digit index answers exact matches with one lookup, the trie
+        # frontier is the fallback when no index was loaded
+        if self.digit_index is not None:
+            return self.digit_index.lookup(self.result_digits)
+        return self.dictionary.frontier_words(frontier)
+
+    def page_count(self):
+        return (self.result_total + self.page_size - 1) // self.page_size
+
+    def show_page(self, page):
+        # Clamp the page to the available range and build only its combinations
+        pages = self.page_count()
+        if not pages:
+            if self.result_words is not None:
+                self.page_label.config(text="Page 0 / 0")
+                self.result_label.config(text="No words found.")
+            return
+        self.page = max(0, min(page, pages - 1))
+
+        # Random access by rank, so any page costs the same to build
+        start = self.page * self.page_size
+        stop = min(start + self.page_size, self.result_total)
+        if self.result_words is not None:
+            result = self.result_words[start:stop]
+        else:
+            result = list(self.combination_range(self.result_letters, start, stop))
+
+        self.result_label.config(text=f"Result: {result}")
+        self.page_label.config(text=f"Page {self.page + 1} / {pages} ({self.result_total} combinations)")
+
+    def jump_to_page(self):
+        # Pages are numbered from 1 in the entry field
+        try:
+            page = int(self.page_entry.get())
+        except ValueError:
+            return
+        self.show_page(page - 1)
+
+    def show_random(self):
+        # Show a page of combinations sampled uniformly from all of them
+        if not self.result_total:
+            return
+        if self.result_words is not None:
+            result = sample(self.result_words, min(self.page_size, self.result_total))
+            self.result_label.config(text=f"Random: {result}")
+            return
+        result = self.sample_combinations(self.result_letters, min(self.page_size, self.result_total))
+        self.result_label.config(text=f"Random: {result}")
+
+    def start_search(self):
+        pattern = self.search_entry.get()
+        if not self.result_letters or not pattern:
+            return
+        try:
+            re.compile(pattern)
+        except re.error as error:
+            self.result_label.config(text=f"Invalid pattern: {error}")
+            return
+
+        self.cancel_search()
+        self.search = ShardedEnumeration(self.result_letters, pattern=pattern,
+                                         hit_limit=self.search_hit_limit).start()
+        self.poll_search()
+
+    def poll_search(self):
+        # Check the pool from the Tk loop, the window never waits for it
+        if self.search is None:
+            return
+        done, total = self.search.progress()
+        if not self.search.done():
+            self.page_label.config(text=f"Searching: {done} / {total} shards")
+            self.root.after(100, self.poll_search)
+            return
+
+        search, self.search = self.search, None
+        try:
+            results = search.results()
+        except Exception as error:
+            # A failed worker (broken pool, pickling error, ...) ends the search
+            self.page_label.config(text="Search failed")
+            self.result_label.config(text=f"Search failed: {error!r}")
+            return
+        self.result_words = [word for result in results for word in result['hits']]
+        self.result_total = len(self.result_words)
+        matches = sum(result['matches'] for result in results)
+        self.show_page(0)
+        self.page_label.config(text=f"{self.page_label.cget('text')} of {matches} matches")
+
+    def cancel_search(self):
+        if self.search is not None:
+            self.search.cancel()
+            self.search = None
+            self.page_label.config(text="Search cancelled")
+
+    def letters_list(self, selected_digits):
+        return [self.selected_letters.get(digit) or self.digit_map[str(digit)] for digit in selected_digits]
 
-    def letter_combinations(self, selected_digits):
-        digit_map = {
-            '2': 'abc',
-            '3': 'def',
-            '4': 'ghi',
-            '5': 'jkl',
-            '6': 'mno',
-            '7': 'pqrs',
-            '8': 'tuv',
-            '9': 'wxyz'
-        }
-
-        # Generate all possible combinations of selected letters
-        letters_list = [self.selected_letters[digit] or digit_map[str(digit)] for digit in selected_digits]
-        combinations = [''.join(combination) for combination in product(*letters_list)]
+    def combination_count(self, selected_digits):
+        # Total number of combinations without building them
+        return prod(len(letters) for letters in self.letters_list(selected_digits))
+
+    @staticmethod
+    def iter_combinations(letters_list):
+        # Lazily yield combinations, one string at a time
+        for combination in product(*letters_list):
+            yield ''.join(combination)
+
+    @staticmethod
+    def combination_at(letters_list, index):
+        # Unrank: read the index as a mixed-radix number, the last digit is the
+        # least significant one, which matches the order of product()
+        total = prod(len(letters) for letters in letters_list)
+        if not 0 <= index < total:
+            raise IndexError("combination index out of range")
+
+        chars = []
+        for letters in reversed(letters_list):
+            index, pos = divmod(index, len(letters))
+            chars.append(letters[pos])
+        return ''.join(reversed(chars))
+
+    @staticmethod
+    def combination_rank(letters_list, word):
+        # Rank: inverse of combination_at
+        if len(word) != len(letters_list):
+            raise ValueError(f"{word!r} has {len(word)} letters, expected {len(letters_list)}")
+
+        rank = 0
+        for letters, char in zip(letters_list, word):
+            if char not in letters:
+                raise ValueError(f"{char!r} is not one of {letters!r}")
+            rank = rank * len(letters) + letters.index(char)
+        return rank
+
+    @classmethod
+    def combination_range(cls, letters_list, start, stop):
+        # Yield combinations with ranks in [start, stop) without building the ones before
+        for index in range(start, stop):
+            yield cls.combination_at(letters_list, index)
+
+    @classmethod
+    def sample_combinations(cls, letters_list, k):
+        # Uniform sample without replacement, sample() over a range does not materialize it
+        total = prod(len(letters) for letters in letters_list)
+        return [cls.combination_at(letters_list, index) for index in sample(range(total), k)]
+
+    def letter_combinations(self, selected_digits, combination_filter=None):
+        # Generate all possible combinations of selected letters, a
+        # CombinationFilter prunes them while they are built
+        letters_list = self.letters_list(selected_digits)
+        if combination_filter is not None:
+            combinations = list(combination_filter.combinations(letters_list))
+        else:
+            combinations = list(self.iter_combinations(letters_list))
 
         return combinations
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Phone Keypad Word Combinations")
+    # Optional word list (one word per line) enables the "Words only" mode
+    parser.add_argument('words', nargs='?', help="word list, one word per line")
+    parser.add_argument('--export', nargs=2, metavar=('DIGITS', 'PATH'),
+                        help="write every combination of DIGITS to PATH (.npy or text) without the GUI")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="export a text file in rank-range shards on this many processes")
+    args = parser.parse_args()
+
+    if args.export and not (args.export[0] and all(digit in PhoneKeypadApp.digit_map for digit in args.export[0])):
+        parser.error(f"--export DIGITS must only contain the keys {''.join(PhoneKeypadApp.digit_map)}, "
+                     f"got {args.export[0]!r}")
+
+    if args.export and args.workers > 1 and args.export[1].endswith('.npy'):
+        parser.error("--workers only writes text files, export a .npy file with a single worker")
+
+    if args.export and args.workers > 1:
+        digits, path = args.export
+        started = time.perf_counter()
+        # A fresh directory next to the output, so nothing existing is removed
+        shard_dir = tempfile.mkdtemp(dir=os.path.dirname(path) or '.')
+        job = ShardedEnumeration([PhoneKeypadApp.digit_map[digit] for digit in digits],
+                                 workers=args.workers, output_dir=shard_dir).start()
+        job.merge(path)
+        shutil.rmtree(shard_dir)
+        seconds = time.perf_counter() - started
+        print(f"{job.total} combinations in {seconds:.2f}s on {job.workers} processes "
+              f"({job.total / seconds:,.0f} combinations/s)")
+        raise SystemExit
+
+    if args.export:
+        stats = export_combinations(*args.export)
+        print(f"{stats['count']} combinations, {stats['bytes']} bytes in {stats['seconds']:.2f}s "
+              f"({stats['per_second']:,.0f} combinations/s)")
+        raise SystemExit
+
+    dictionary = digit_index = None
+    if args.words:
+        dictionary = T9Dictionary.load(args.words)
+        digit_index = DigitIndex.load(args.words)
+
     root = tk.Tk()
-    app = PhoneKeypadApp(root)
+    app = PhoneKeypadApp(root, dictionary, digit_index)
     root.mainloop()
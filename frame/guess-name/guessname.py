@@ -1,6 +1,522 @@
+import bisect
+import mmap
+import os
+import struct
+import sys
+import time
 import tkinter as tk
-from tkinter import ttk
-from random import choice
+from array import array
+from collections import OrderedDict, deque
+from itertools import accumulate
+from tkinter import font as tkfont
+from random import choice, randrange
+
+
+class NameIndex:
+    """
+    A sorted, memory-mapped index of a large name list.
+
+    The index file holds a header, the offsets of every name and the sorted names as one UTF-8 blob.
+    It is built once from the name list and memory-mapped afterwards, so opening it is near-instant and
+    a name becomes a Python string only when it is read. Prefix queries binary-search the raw bytes.
+
+    Attributes:
+        path (str): The path of the index file.
+        count (int): The number of names.
+        longest (str): The longest name, used to size the columns of a NameCanvas.
+
+    """
+
+    MAGIC = b"NAMEIDX1"
+    HEADER = struct.Struct("<8sQQ")
+
+    def __init__(self, path):
+        """
+        Opens an index file built by NameIndex.build.
+
+        Args:
+            path (str): The path of the index file.
+
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, longest = self.HEADER.unpack_from(self.mm)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a name index")
+        offsets_end = self.HEADER.size + 8 * (self.count + 1)
+        self.offsets = memoryview(self.mm)[self.HEADER.size:offsets_end].cast("Q")
+        if sys.byteorder == "big":
+            self.offsets = array("Q", self.offsets)
+            self.offsets.byteswap()
+        self.blob_start = offsets_end
+        self.longest = self[longest] if self.count else ""
+
+    @classmethod
+    def build(cls, source, path):
+        """
+        Builds the index file of a name list.
+
+        Args:
+            source (str): The name list, one name per line.
+            path (str): The path of the index file to write.
+
+        Raises:
+            ValueError: If a line of the name list is not valid UTF-8.
+
+        """
+        names = []
+        with open(source, "rb") as file:
+            for number, line in enumerate(file, 1):
+                name = line.strip()
+                try:
+                    name.decode("utf-8")
+                except UnicodeDecodeError as error:
+                    raise ValueError(f"{source}, line {number}: the name is not valid UTF-8 ({error.reason})") from None
+                if name:
+                    names.append(name)
+        names.sort()
+        # The offsets are stored little-endian like the header
+        offsets = array("Q", accumulate(map(len, names), initial=0))
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        longest = max(range(len(names)), key=lambda idx: len(names[idx]), default=0)
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, len(names), longest))
+            file.write(offsets.tobytes())
+            file.write(b"".join(names))
+
+    @classmethod
+    def open(cls, source, path=None):
+        """
+        Opens the index of a name list, building it first if it is missing or older than the list.
+
+        Args:
+            source (str): The name list, one name per line.
+            path (str): The path of the index file, next to the name list by default.
+
+        Returns:
+            NameIndex: The opened index.
+
+        """
+        path = path or source + ".idx"
+        if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source):
+            cls.build(source, path)
+        return cls(path)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        return self.raw(idx).decode("utf-8")
+
+    def raw(self, idx):
+        """
+        Reads the bytes of one name without decoding them.
+
+        Args:
+            idx (int): The position of the name in sorted order.
+
+        Returns:
+            bytes: The UTF-8 encoded name.
+
+        """
+        if idx < 0:
+            idx += self.count
+        if not 0 <= idx < self.count:
+            raise IndexError("name index out of range")
+        return self.mm[self.blob_start + self.offsets[idx]:self.blob_start + self.offsets[idx + 1]]
+
+    def bisect_left(self, key):
+        """
+        Finds the first position whose name is not smaller than the key.
+
+        Args:
+            key (bytes): The UTF-8 encoded key.
+
+        Returns:
+            int: The insertion position of the key.
+
+        """
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            if self.raw(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def prefix_range(self, prefix):
+        """
+        Finds the positions of the names that start with a prefix.
+
+        Args:
+            prefix (str): The prefix.
+
+        Returns:
+            range: The positions of the matching names in sorted order.
+
+        """
+        key = prefix.encode("utf-8")
+        # 0xFF never occurs in UTF-8, so every name starting with the prefix sorts before key + 0xFF
+        return range(self.bisect_left(key), self.bisect_left(key + b"\xff"))
+
+    def random_name(self):
+        """
+        Picks a random name.
+
+        Returns:
+            str: The picked name.
+
+        """
+        return self[randrange(self.count)]
+
+
+class NameView:
+    """
+    A read-only view of a range of positions in a name sequence, so a filtered list of names is never copied.
+
+    """
+
+    def __init__(self, names, positions):
+        """
+        Initializes the NameView instance.
+
+        Args:
+            names (Sequence[str]): The names the view reads from.
+            positions (range): The positions of the visible names.
+
+        """
+        self.names = names
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, idx):
+        return self.names[self.positions[idx]]
+
+
+class NameLayout:
+    """
+    The column-major layout of a multi-column name grid.
+
+    The most recent layouts are cached per (name count, column count, font, column width) in a small LRU,
+    and text widths and line heights are measured once per font, so reopening or resizing a name window
+    does not measure any widget again. A cell position is computed from the cached layout in constant time.
+
+    Attributes:
+        count (int): The number of names.
+        num_columns (int): The number of columns.
+        num_rows (int): The number of rows.
+        column_width (int): The width of a column in pixels.
+        row_height (int): The height of a row in pixels.
+
+    """
+
+    # Every filter result size and window width gives a new layout, so only
+    # the most recent ones are kept
+    max_layouts = 32
+
+    _layouts = OrderedDict()
+    _widths = {}
+    _heights = {}
+
+    def __init__(self, count, num_columns, column_width, row_height):
+        """
+        Initializes the NameLayout instance.
+
+        Args:
+            count (int): The number of names.
+            num_columns (int): The number of columns.
+            column_width (int): The width of a column in pixels.
+            row_height (int): The height of a row in pixels.
+
+        """
+        self.count = count
+        self.num_columns = max(1, num_columns)
+        self.num_rows = max(1, (count + self.num_columns - 1) // self.num_columns)
+        self.column_width = column_width
+        self.row_height = row_height
+
+    @staticmethod
+    def font_key(font):
+        """
+        Builds a hashable key from the actual attributes of a font.
+
+        Args:
+            font (Font): The font.
+
+        Returns:
+            tuple: The font key.
+
+        """
+        return tuple(sorted(font.actual().items()))
+
+    @classmethod
+    def measure(cls, font, text):
+        """
+        Measures the width of a text, once per font and text.
+
+        Args:
+            font (Font): The font.
+            text (str): The text.
+
+        Returns:
+            int: The width in pixels.
+
+        """
+        key = (cls.font_key(font), text)
+        if key not in cls._widths:
+            cls._widths[key] = font.measure(text)
+        return cls._widths[key]
+
+    @classmethod
+    def line_height(cls, font):
+        """
+        Measures the line height of a font, once per font.
+
+        Args:
+            font (Font): The font.
+
+        Returns:
+            int: The line height in pixels.
+
+        """
+        key = cls.font_key(font)
+        if key not in cls._heights:
+            cls._heights[key] = font.metrics("linespace")
+        return cls._heights[key]
+
+    @classmethod
+    def get(cls, count, num_columns, font, longest, padding=10):
+        """
+        Gets the cached layout of a name grid, computing it on first use.
+
+        Args:
+            count (int): The number of names.
+            num_columns (int): The number of columns.
+            font (Font): The font of the names.
+            longest (str): The longest name, which sets the column width.
+            padding (int): The space between columns in pixels.
+
+        Returns:
+            NameLayout: The layout.
+
+        """
+        column_width = cls.measure(font, longest + "MM") + padding
+        key = (count, max(1, num_columns), cls.font_key(font), column_width)
+        if key in cls._layouts:
+            cls._layouts.move_to_end(key)
+        else:
+            cls._layouts[key] = cls(count, num_columns, column_width, cls.line_height(font))
+            if len(cls._layouts) > cls.max_layouts:
+                cls._layouts.popitem(last=False)
+        return cls._layouts[key]
+
+    def position(self, idx):
+        """
+        Computes the top-left corner of a cell.
+
+        Args:
+            idx (int): The position of the name.
+
+        Returns:
+            tuple: The x and y coordinates in pixels.
+
+        """
+        return (idx // self.num_rows) * self.column_width, (idx % self.num_rows) * self.row_height
+
+    def size(self):
+        """
+        Computes the size of the whole grid.
+
+        Returns:
+            tuple: The width and height in pixels.
+
+        """
+        return self.column_width * self.num_columns, self.row_height * self.num_rows
+
+
+class NameCanvas:
+    """
+    A scrollable multi-column name viewer drawn on a single Canvas.
+
+    Names are laid out in column-major order by a NameLayout, but only the rows inside the visible viewport
+    are drawn. Text items are kept in a pool and reused when the view is scrolled or resized, so the cost
+    of a redraw depends on the window size, not on the number of names. Resizes are coalesced into one
+    relayout per idle cycle.
+
+    Attributes:
+        names (List[str]): The names to display.
+        font (Font): The font of the names.
+        longest (str): The longest name.
+        fit_columns (bool): Whether the number of columns follows the width of the window.
+        layout (NameLayout): The current layout.
+        canvas (Canvas): The canvas the names are drawn on.
+        items (List[int]): The pool of canvas text items.
+
+    """
+
+    def __init__(self, master, names, num_columns, font, width=600, height=400, fit_columns=False):
+        """
+        Initializes the NameCanvas instance.
+
+        Args:
+            master (Widget): The parent widget.
+            names (List[str]): The names to display.
+            num_columns (int): The number of columns, the initial one when fit_columns is set.
+            font (Font): The font of the names.
+            width (int): The maximal width of the viewport in pixels.
+            height (int): The maximal height of the viewport in pixels.
+            fit_columns (bool): Whether the number of columns follows the width of the window.
+
+        """
+        self.names = names
+        self.font = font
+        if isinstance(names, NameIndex):
+            self.longest = names.longest
+        else:
+            self.longest = max(names, key=len, default="")
+        self.fit_columns = fit_columns
+        self.layout = NameLayout.get(len(names), num_columns, font, self.longest)
+        self.items = []
+        self.configure_job = None
+
+        content_width, content_height = self.layout.size()
+        self.canvas = tk.Canvas(master, width=min(width, content_width), height=min(height, content_height),
+                                scrollregion=(0, 0, content_width, content_height), highlightthickness=0)
+        self.y_scroll = tk.Scrollbar(master, orient="vertical", command=self.yview)
+        self.x_scroll = tk.Scrollbar(master, orient="horizontal", command=self.xview)
+        self.canvas.configure(yscrollcommand=self.y_scroll.set, xscrollcommand=self.x_scroll.set)
+
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.y_scroll.grid(row=0, column=1, sticky="ns")
+        self.x_scroll.grid(row=1, column=0, sticky="ew")
+        master.grid_rowconfigure(0, weight=1)
+        master.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda event: self.schedule_relayout())
+        self.canvas.bind("<Destroy>", lambda event: self.cancel_relayout())
+        self.canvas.bind("<MouseWheel>", lambda event: self.yview("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+
+    def schedule_relayout(self):
+        """
+        Coalesces <Configure> events: however many arrive, the grid is laid out once when Tk is idle.
+
+        """
+        if self.configure_job is None:
+            self.configure_job = self.canvas.after_idle(self.on_configure)
+
+    def cancel_relayout(self):
+        """
+        Cancels a pending relayout, used when the canvas is destroyed.
+
+        """
+        if self.configure_job is not None:
+            self.canvas.after_cancel(self.configure_job)
+            self.configure_job = None
+
+    def on_configure(self):
+        """
+        Lays the grid out again for the new window size.
+
+        """
+        self.configure_job = None
+        num_columns = self.layout.num_columns
+        if self.fit_columns:
+            num_columns = max(1, self.canvas.winfo_width() // self.layout.column_width)
+        if num_columns != self.layout.num_columns:
+            self.relayout(num_columns)
+        else:
+            self.redraw()
+
+    def relayout(self, num_columns=None):
+        """
+        Applies the cached layout for the current names and number of columns.
+
+        Args:
+            num_columns (int): The new number of columns, unchanged when not given.
+
+        """
+        self.layout = NameLayout.get(len(self.names), num_columns or self.layout.num_columns,
+                                     self.font, self.longest)
+        self.canvas.configure(scrollregion=(0, 0) + self.layout.size())
+        self.redraw()
+
+    def set_names(self, names):
+        """
+        Replaces the displayed names, keeping the column width, and scrolls back to the top.
+
+        Args:
+            names (Sequence[str]): The names to display.
+
+        """
+        self.names = names
+        self.canvas.yview_moveto(0)
+        self.relayout()
+
+    def yview(self, *args):
+        """
+        Scrolls the canvas vertically and redraws the visible names.
+
+        """
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def xview(self, *args):
+        """
+        Scrolls the canvas horizontally and redraws the visible names.
+
+        """
+        self.canvas.xview(*args)
+        self.redraw()
+
+    def visible_cells(self):
+        """
+        Computes the rows and columns inside the viewport.
+
+        Returns:
+            tuple: The range of visible rows and the range of visible columns.
+
+        """
+        layout = self.layout
+        top = self.canvas.canvasy(0)
+        left = self.canvas.canvasx(0)
+        height = self.canvas.winfo_height()
+        width = self.canvas.winfo_width()
+        first_row = max(0, int(top // layout.row_height))
+        last_row = min(layout.num_rows, int((top + height) // layout.row_height) + 1)
+        first_col = max(0, int(left // layout.column_width))
+        last_col = min(layout.num_columns, int((left + width) // layout.column_width) + 1)
+        return range(first_row, last_row), range(first_col, last_col)
+
+    def redraw(self):
+        """
+        Draws the names of the visible cells, reusing the text items of the pool.
+
+        """
+        rows, cols = self.visible_cells()
+        used = 0
+        for col in cols:
+            for row in rows:
+                idx = col * self.layout.num_rows + row
+                if idx >= len(self.names):
+                    break
+                x, y = self.layout.position(idx)
+                if used < len(self.items):
+                    item = self.items[used]
+                    self.canvas.coords(item, x, y)
+                    self.canvas.itemconfigure(item, text=self.names[idx], state="normal")
+                else:
+                    item = self.canvas.create_text(x, y, text=self.names[idx], anchor="nw", font=self.font)
+                    self.items.append(item)
+                used += 1
+        for item in self.items[used:]:
+            self.canvas.itemconfigure(item, state="hidden")
 
 
 class GuessName:
@@ -10,16 +526,23 @@ class GuessName:
     Attributes:
         master (Tk): The root Tkinter window.
         alphabet (List[str]): The list of alphabet letters.
-        names (List[str]): The list of generated names.
+        names (List[str] or NameIndex): The list of generated names, or the index of a loaded name list.
+        names_path (str): The path of a name list to load instead of generating names.
+        sorted_names (List[str] or NameIndex): The names in sorted order, for the prefix filter.
+        filter_times (deque[float]): The duration in seconds of the most recent prefix lookups of the filter.
 
     Methods:
-        __init__(master): Initializes the GuessName instance.
+        __init__(master, names_path): Initializes the GuessName instance.
         build_gui(): Builds the GUI for the game.
         create_labels_entries_buttons(): Creates labels, entries, and buttons in the GUI.
         generate_alphabet(): Generates the list of alphabet letters.
-        generate_names(): Generates a list of random names.
+        generate_names(): Generates a list of random names, or loads the name list.
+        show_random_name(): Shows a random name.
         show_all_names(): Displays all the generated names.
-        validate_and_show_names(): Validates input and shows all the generated names.
+        validate_and_show_names(): Validates input and shows all the generated names on a NameCanvas.
+        schedule_filter(): Debounces the filter entry of the All Names window.
+        filter_names(prefix): Finds the names starting with a prefix.
+        apply_filter(): Shows the names matching the filter entry.
         create_top_window(): Creates a new top-level window to display all names.
         get_num_columns(): Retrieves the number of columns from the entry field.
         center_frame(): Centers the frame within the top-level window.
@@ -27,17 +550,25 @@ class GuessName:
 
     """
 
-    def __init__(self, master):
+    # Only the most recent lookup durations are kept, the filter runs on every pause in typing
+    max_filter_times = 100
+
+    def __init__(self, master, names_path=None):
         """
         Initializes the GuessName instance.
 
         Args:
             master (Tk): The root Tkinter window.
+            names_path (str): The path of a name list (one name per line) to load instead of generating names.
 
         """
         self.master = master
         self.alphabet = []
         self.names = []
+        self.names_path = names_path
+        self.sorted_names = []
+        self.filter_times = deque(maxlen=self.max_filter_times)
+        self.filter_job = None
         self.build_gui()
 
     def build_gui(self):
@@ -45,7 +576,7 @@ class GuessName:
         Builds the GUI for the game.
 
         """
-        self.master.geometry("250x100")
+        self.master.geometry("250x130")
         self.create_labels_entries_buttons()
         self.generate_alphabet()
         self.generate_names()
@@ -67,6 +598,9 @@ class GuessName:
         self.button = tk.Button(self.master, text='Show All Names', command=self.show_all_names)
         self.button.pack()
 
+        self.random_button = tk.Button(self.master, text='Random Name', command=self.show_random_name)
+        self.random_button.pack()
+
     def generate_alphabet(self):
         """
         Generates the list of alphabet letters.
@@ -76,10 +610,25 @@ class GuessName:
 
     def generate_names(self):
         """
-        Generates a list of random names.
+        Generates a list of random names, or loads the name list into a NameIndex.
 
         """
+        if self.names_path:
+            self.names = self.sorted_names = NameIndex.open(self.names_path)
+            return
         self.names = [choice(self.alphabet) + n + choice(self.alphabet) for n in self.alphabet]
+        self.sorted_names = sorted(self.names)
+
+    def show_random_name(self):
+        """
+        Shows a random name.
+
+        """
+        if isinstance(self.names, NameIndex):
+            name = self.names.random_name()
+        else:
+            name = choice(self.names)
+        self.label.config(text=f'Guess Name: {name}')
 
     def show_all_names(self):
         """
@@ -95,17 +644,13 @@ class GuessName:
         """
         if not hasattr(self, "top") or not self.top.winfo_exists():
             self.create_top_window()
-            num_names = len(self.names)
             num_columns = self.get_num_columns()
 
-            num_rows = (num_names + num_columns - 1) // num_columns
-
-            for idx, name in enumerate(self.names):
-                row = idx % num_rows
-                col = idx // num_rows
-
-                label = ttk.Label(self.frame, text=name, style="NameLabel.TLabel")
-                label.grid(row=row, column=col, sticky="w")
+            # Column-major layout: row = idx % num_rows, col = idx // num_rows,
+            # only the visible names are drawn. Without a column count the
+            # columns follow the width of the window
+            self.name_canvas = NameCanvas(self.names_frame, self.names, num_columns, self.name_font,
+                                          fit_columns=not self.entry_column.get())
 
             self.center_frame()
 
@@ -118,11 +663,85 @@ class GuessName:
         self.top.title('All Names')
         self.top.geometry('+%d+%d' % (self.master.winfo_rootx() + self.master.winfo_width(),
                                        self.master.winfo_rooty()))
+        self.top.bind("<Destroy>", self.on_top_destroy)
+        self.filter_job = None
         self.frame = tk.Frame(self.top)
-        self.frame.pack(padx=10, pady=10)
+        self.frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+        filter_bar = tk.Frame(self.frame)
+        filter_bar.pack(fill="x")
+        tk.Label(filter_bar, text='Filter:').pack(side="left")
+        self.filter_entry = tk.Entry(filter_bar)
+        self.filter_entry.pack(side="left", fill="x", expand=True)
+        self.filter_entry.bind("<KeyRelease>", lambda event: self.schedule_filter())
+        self.filter_label = tk.Label(filter_bar, text=f'{len(self.names)} names')
+        self.filter_label.pack(side="left")
+
+        self.names_frame = tk.Frame(self.frame)
+        self.names_frame.pack(fill="both", expand=True)
+
+        self.name_font = tkfont.Font(self.top, family="Arial", size=14, weight="bold")
+
+    def on_top_destroy(self, event):
+        """
+        Cancels the pending filter when the top-level window is closed, its widgets are gone.
+
+        Args:
+            event (Event): The <Destroy> event, also sent for every child of the window.
+
+        """
+        if event.widget is self.top and self.filter_job is not None:
+            self.top.after_cancel(self.filter_job)
+            self.filter_job = None
 
-        style = ttk.Style()
-        style.configure("NameLabel.TLabel", font=("Arial", 14, "bold"))
+    def schedule_filter(self, delay=150):
+        """
+        Debounces the filter entry: the names are filtered once typing pauses for delay milliseconds.
+
+        Args:
+            delay (int): The pause in milliseconds.
+
+        """
+        if self.filter_job is not None:
+            self.top.after_cancel(self.filter_job)
+        self.filter_job = self.top.after(delay, self.apply_filter)
+
+    def filter_names(self, prefix):
+        """
+        Finds the names starting with a prefix by a bisect range lookup in the sorted names.
+
+        Args:
+            prefix (str): The prefix.
+
+        Returns:
+            NameView: The matching names in sorted order.
+
+        """
+        started = time.perf_counter()
+        if isinstance(self.sorted_names, NameIndex):
+            positions = self.sorted_names.prefix_range(prefix)
+        else:
+            low = bisect.bisect_left(self.sorted_names, prefix)
+            high = bisect.bisect_left(self.sorted_names, prefix + chr(sys.maxunicode))
+            positions = range(low, high)
+        self.filter_times.append(time.perf_counter() - started)
+        return NameView(self.sorted_names, positions)
+
+    def apply_filter(self):
+        """
+        Shows the names matching the filter entry and the duration of the lookup.
+
+        """
+        self.filter_job = None
+        prefix = self.filter_entry.get()
+        if prefix:
+            names = self.filter_names(prefix)
+            lookup_ms = self.filter_times[-1] * 1000
+            self.filter_label.config(text=f'{len(names)} names, {lookup_ms:.3f} ms')
+        else:
+            names = self.names
+            self.filter_label.config(text=f'{len(names)} names')
+        self.name_canvas.set_names(names)
 
     def get_num_columns(self):
         """
@@ -147,9 +766,11 @@ class GuessName:
         """
         Centers the frame within the top-level window.
 
+        The frame is packed to fill the window, so it stays centered and the name canvas follows it when
+        the window is resized, without waiting for a synchronous geometry update.
+
         """
-        self.frame.update_idletasks()
-        self.frame.place(relx=0.5, rely=0.8, anchor="center")
+        self.frame.pack_configure(anchor="center", fill="both", expand=True)
 
     def run_game(self):
         """
@@ -161,5 +782,6 @@ class GuessName:
 
 if __name__ == "__main__":
     root = tk.Tk()
-    game = GuessName(root)
+    # Optional name list, one name per line
+    game = GuessName(root, sys.argv[1] if len(sys.argv) > 1 else None)
     game.run_game()
@@ -1,83 +1,372 @@
+import queue
+import threading
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from random import choice
+from matplotlib.transforms import Bbox
+from collections import OrderedDict
+from time import perf_counter
+from random import randrange
 
 
-def generator_names(size, desired_letters):
+base_names = sorted(["Alice", "Bob", "Charlie", "David", "Eve", "Frank", "George", "Alex", "Eleanor"])
+
+
+def letter_probabilities(desired_letters, alphabet, weights=None, desired_share=0.25):
     """
-    Generate names with modified occurrence of letters.
+    Compute the probability of each letter of the alphabet to start a name.
 
     Args:
-        size (int): The number of names to generate.
         desired_letters (list): List of letters with desired higher occurrence.
+        alphabet (list): List of letters in the alphabet.
+        weights (dict): Optional weight per letter, it replaces the desired letters when given.
+        desired_share (float): The share of names starting with one of the desired letters.
 
     Returns:
-        list: Generated names.
+        np.ndarray: The probability of each letter, aligned with the alphabet.
     """
-    names = ["Alice", "Bob", "Charlie", "David", "Eve", "Frank", "George", "Alex", "Eleanor"]
-    alphabet = [chr(n).lower() for n in range(ord('A'), ord('Z') + 1)]
-    
-    # desired_letters = ['a', 'z', 'b', 'g']
-    other_letters = [letter for letter in alphabet if letter not in desired_letters]
-    
-    generated_names = []
-    
-    while len(generated_names) < size:
-        if len(generated_names) % 4 == 0: # 25% of all letters of alphabet
-                                        # approximately 25% of all letters of the alphabet
-            letter = choice(desired_letters)
-        else:
-            letter = choice(other_letters)
-        name = f"{letter}{choice(names)}"
-        generated_names.append(name)
-    
-    generated_names.sort()
-    
-    return generated_names
+    if weights:
+        probabilities = np.array([weights.get(letter, 0) for letter in alphabet], dtype=float)
+    else:
+        desired = np.isin(alphabet, list(desired_letters))
+        probabilities = np.ones(len(alphabet))
+        if desired.any() and not desired.all():
+            # approximately 25% of all names start with a desired letter
+            probabilities[desired] = desired_share / desired.sum()
+            probabilities[~desired] = (1 - desired_share) / (~desired).sum()
+    return probabilities / probabilities.sum()
 
 
-def create_matrix(names, alphabet):
+class GenerationCancelled(Exception):
     """
-    Create a matrix of names sorted by the first letter.
+    Raised by a progress callback to stop a generation that is no longer needed.
+    """
+
+
+def generate_name_counts(size, probabilities, seed=None, progress=None, chunk_size=10 ** 6):
+    """
+    Draw the first letters and base names of all names in bulk, without building any string.
 
     Args:
-        names (list): List of names.
+        size (int): The number of names to generate.
+        probabilities (np.ndarray): The probability of each letter of the alphabet.
+        seed (int): Seed of the random generator, the same seed gives the same counts.
+        progress (callable): Optional callback called with the number of names drawn after each chunk,
+            it may raise GenerationCancelled to stop.
+        chunk_size (int): The number of names drawn at once.
+
+    Returns:
+        np.ndarray: The number of names per (letter, base name), one row per letter of the alphabet.
+    """
+    rng = np.random.default_rng(seed)
+    probabilities = np.asarray(probabilities, dtype=float) / np.sum(probabilities)
+
+    pairs = np.zeros(len(probabilities) * len(base_names), dtype=np.int64)
+    for start in range(0, size, chunk_size):
+        count = min(chunk_size, size - start)
+        letters = rng.choice(len(probabilities), count, p=probabilities)
+        bases = rng.integers(0, len(base_names), count)
+        pairs += np.bincount(letters * len(base_names) + bases, minlength=len(pairs))
+        if progress is not None:
+            progress(start + count)
+    return pairs.reshape(len(probabilities), len(base_names))
+
+
+def names_from_counts(pair_counts, alphabet):
+    """
+    Build the sorted names from the counts of each (letter, base name).
+
+    Args:
+        pair_counts (np.ndarray): The number of names per (letter, base name).
         alphabet (list): List of letters in the alphabet.
 
     Returns:
-        list: Name matrix sorted by the first letter.
+        np.ndarray: Sorted names.
+    """
+    # Base names are sorted and none is a prefix of another, so the names come
+    # out sorted when the pairs are repeated in (letter, base name) order
+    combinations = np.array([f"{letter}{name}" for letter in alphabet for name in base_names], dtype=object)
+    return combinations.repeat(pair_counts.ravel())
+
+
+def generator_names(size, desired_letters, seed=None, weights=None):
+    """
+    Generate names with modified occurrence of letters.
+
+    Args:
+        size (int): The number of names to generate.
+        desired_letters (list): List of letters with desired higher occurrence.
+        seed (int): Seed of the random generator, the same seed gives the same names.
+        weights (dict): Optional weight per letter, it replaces the desired letters when given.
+
+    Returns:
+        list: Generated names.
+    """
+    alphabet = [chr(n).lower() for n in range(ord('A'), ord('Z') + 1)]
+    probabilities = letter_probabilities(desired_letters, alphabet, weights)
+    return names_from_counts(generate_name_counts(size, probabilities, seed), alphabet).tolist()
+
+
+class NameBuckets:
     """
-    alphabet_mapping = {n: idx for idx, n in enumerate(alphabet)}
-    m = [[] for _ in range(len(alphabet))]
+    Names grouped by their first letter in one contiguous array.
 
-    for n in names:
-        first_letter = n[0].lower()
-        if first_letter in alphabet_mapping:
-            col_idx = alphabet_mapping[first_letter]
-            m[col_idx].append(n)
+    The names of the letter at position i of the alphabet are names[offsets[i]:offsets[i + 1]], so a bucket,
+    its count and a random name are O(1) slices of the same array, and the buckets stay aligned with the
+    alphabet even when some of them are empty.
 
+    Generated names are only kept as counts per (letter, base name): the offsets come from the counts and a
+    bucket is built when it is asked for, so no name is stored.
 
-    matrix = list(filter(lambda n: n, m))
+    Attributes:
+        alphabet (list): List of letters in the alphabet.
+        offsets (np.ndarray): The start of each bucket, plus the end of the last one.
+        names (np.ndarray): All names, grouped by first letter in alphabet order, or None for generated names.
+        pair_counts (np.ndarray): The number of names per (letter, base name) of generated names, or None.
+    """
 
-    return matrix
+    def __init__(self, alphabet, offsets, names=None, pair_counts=None):
+        self.alphabet = alphabet
+        self.alphabet_mapping = {n: idx for idx, n in enumerate(alphabet)}
+        self.offsets = offsets
+        self.names = names
+        self.pair_counts = pair_counts
+
+    @classmethod
+    def from_names(cls, names, alphabet):
+        """
+        Group names by their first letter, names starting with a letter outside the alphabet are dropped.
+
+        Args:
+            names (list): List of names.
+            alphabet (list): List of letters in the alphabet.
+
+        Returns:
+            NameBuckets: The grouped names.
+        """
+        alphabet_mapping = {n: idx for idx, n in enumerate(alphabet)}
+        columns = np.array([alphabet_mapping.get(n[:1].lower(), -1) for n in names], dtype=np.intp)
+        kept = np.flatnonzero(columns >= 0)
+        # A stable sort keeps sorted names sorted within their bucket
+        order = kept[np.argsort(columns[kept], kind='stable')]
+        grouped = np.array(names, dtype=object)[order]
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(columns[kept], minlength=len(alphabet)))))
+        return cls(alphabet, offsets, names=grouped)
+
+    @classmethod
+    def from_counts(cls, pair_counts, alphabet):
+        """
+        Group generated names from the counts of each (letter, base name), without building them.
+
+        Args:
+            pair_counts (np.ndarray): The number of names per (letter, base name).
+            alphabet (list): List of letters in the alphabet.
+
+        Returns:
+            NameBuckets: The grouped names.
+        """
+        offsets = np.concatenate(([0], np.cumsum(pair_counts.sum(axis=1))))
+        return cls(alphabet, offsets, pair_counts=pair_counts)
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def bucket(self, letter):
+        """
+        Get the names starting with a letter.
+
+        Args:
+            letter (str): The first letter.
+
+        Returns:
+            np.ndarray: The names of the bucket, a view of the names array, or built from the counts.
+        """
+        col_idx = self.alphabet_mapping[letter]
+        if self.names is None:
+            return names_from_counts(self.pair_counts[col_idx:col_idx + 1], [letter])
+        return self.names[self.offsets[col_idx]:self.offsets[col_idx + 1]]
+
+    def counts(self):
+        """
+        Count the names of each bucket.
+
+        Returns:
+            np.ndarray: The number of names per letter of the alphabet.
+        """
+        return np.diff(self.offsets)
+
+    def random_name(self):
+        """
+        Get a random name of all buckets.
+
+        Returns:
+            str: A random name, or None when there are no names.
+        """
+        if not len(self):
+            return None
+        idx = randrange(len(self))
+        if self.names is not None:
+            return self.names[idx]
+        col_idx = np.searchsorted(self.offsets, idx, side='right') - 1
+        base_idx = np.searchsorted(np.cumsum(self.pair_counts[col_idx]), idx - self.offsets[col_idx], side='right')
+        return f"{self.alphabet[col_idx]}{base_names[base_idx]}"
+
+
+class DatasetCache:
+    """
+    Bounded LRU cache of generated datasets.
 
+    A dataset is the generated names grouped by first letter in NameBuckets, keyed by
+    (size, desired_letters, seed). Only the counts per (letter, base name) are stored, so every dataset
+    takes the same few bytes whatever its size. Repeated filters on the same configuration reuse it, and
+    the least recently used dataset is dropped once the cache is full, so memory stays capped.
 
-def plot_name_distribution(alphabet, matrix):
+    Attributes:
+        alphabet (list): List of letters in the alphabet.
+        maxsize (int): The maximal number of cached datasets.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that generated a dataset.
+        evictions (int): The number of datasets dropped from the cache.
+    """
+
+    def __init__(self, alphabet, maxsize=8):
+        self.alphabet = alphabet
+        self.maxsize = maxsize
+        self.datasets = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, size, desired_letters, seed=None, weights=None, progress=None):
+        """
+        Get the dataset of a configuration, generating it on a miss.
+
+        Args:
+            size (int): The number of names to generate.
+            desired_letters (list): List of letters with desired higher occurrence.
+            seed (int): Seed of the random generator.
+            weights (dict): Optional weight per letter, it replaces the desired letters when given.
+            progress (callable): Optional callback of the generation, see generate_name_counts.
+
+        Returns:
+            NameBuckets: The generated names grouped by first letter.
+        """
+        key = (size, tuple(desired_letters), seed, tuple(sorted(weights.items())) if weights else None)
+        if key in self.datasets:
+            self.hits += 1
+            self.datasets.move_to_end(key)
+            return self.datasets[key]
+
+        self.misses += 1
+        probabilities = letter_probabilities(desired_letters, self.alphabet, weights)
+        pair_counts = generate_name_counts(size, probabilities, seed, progress)
+        self.datasets[key] = NameBuckets.from_counts(pair_counts, self.alphabet)
+        if len(self.datasets) > self.maxsize:
+            self.datasets.popitem(last=False)
+            self.evictions += 1
+        return self.datasets[key]
+
+    def stats(self):
+        """
+        Summarize the cache usage.
+
+        Returns:
+            str: Hits, misses, evictions and the number of cached datasets.
+        """
+        return (f'hits: {self.hits}, misses: {self.misses}, evictions: {self.evictions}, '
+                f'cached: {len(self.datasets)}/{self.maxsize}')
+
+
+class GenerationWorker:
+    """
+    Background thread generating datasets, so the Tk loop never blocks.
+
+    Requests are posted with submit and the results come back through the results queue, which the GUI
+    polls with after(). Only the latest request matters: queued requests are coalesced into the last one,
+    and a running generation is cancelled at its next chunk once a newer request is submitted.
+
+    Messages of the results queue:
+        ('progress', request_id, done, total): names drawn so far.
+        ('done', request_id, buckets, payload): the dataset of a request.
+        ('cancelled', request_id): a request replaced by a newer one.
+        ('error', request_id, error): a request that failed.
+
+    Attributes:
+        cache (DatasetCache): The cache the datasets are taken from, only used by the worker thread.
+        results (queue.Queue): The messages for the GUI.
+        latest (int): The id of the latest request.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.latest = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, size, desired_letters, seed=None, payload=None):
+        """
+        Request a dataset, replacing any pending request.
+
+        Args:
+            size (int): The number of names to generate.
+            desired_letters (list): List of letters with desired higher occurrence.
+            seed (int): Seed of the random generator.
+            payload: Anything the GUI needs back with the result.
+
+        Returns:
+            int: The id of the request.
+        """
+        self.latest += 1
+        self.requests.put((self.latest, size, desired_letters, seed, payload))
+        return self.latest
+
+    def run(self):
+        """
+        Serve the requests, always skipping to the latest one.
+        """
+        while True:
+            request = self.requests.get()
+            while True:
+                try:
+                    newer = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                self.results.put(('cancelled', request[0]))
+                request = newer
+            request_id, size, desired_letters, seed, payload = request
+
+            def progress(done):
+                if request_id != self.latest:
+                    raise GenerationCancelled()
+                self.results.put(('progress', request_id, done, size))
+
+            try:
+                buckets = self.cache.get(size, desired_letters, seed, progress=progress)
+            except GenerationCancelled:
+                self.results.put(('cancelled', request_id))
+            except Exception as error:
+                self.results.put(('error', request_id, error))
+            else:
+                self.results.put(('done', request_id, buckets, payload))
+
+
+def plot_name_distribution(alphabet, buckets):
     """
     Plot the name distribution by the first letter.
 
     Args:
         alphabet (list): List of letters in the alphabet.
-        matrix (list): Name matrix sorted by the first letter.
+        buckets (NameBuckets): Names grouped by the first letter.
 
     Returns:
         tuple: Figure and axes objects for the plot.
     """
     letters = alphabet.copy()
-    counts = [len(names) for names in matrix]
+    counts = buckets.counts()
 
     fig, ax = plt.subplots()
     ax.bar(letters, counts)
@@ -89,43 +378,265 @@ def plot_name_distribution(alphabet, matrix):
     return fig, ax
 
 
+class BarPlot:
+    """
+    Bar chart of the name distribution updated in place with blitting.
+
+    The bars are animated artists, so a full draw caches the axes without them as a background. An update
+    changes the heights and colors of the existing bars, restores the background only under the bars that
+    changed, draws those bars again and blits the changed area. A full draw is only needed when the y
+    axis has to be rescaled.
+
+    Attributes:
+        canvas (FigureCanvas): The canvas of the figure.
+        ax (Axes): The axes of the bar chart.
+        bars (BarContainer): The bars, one per letter of the alphabet.
+        spines (list): The spines of the axes, drawn over the bars.
+        letters (list): The letter of each bar.
+        colors (list): The current color of each bar.
+        extents (list): The pixels each bar covers, cached since the last full draw.
+        color (str): The color of a bar.
+        highlight_color (str): The color of the filtered bar.
+        frame_times (list): The duration of every update in seconds.
+        full_draws (int): The number of updates that needed a full draw.
+    """
+
+    def __init__(self, canvas, ax, letters, color='C0', highlight_color='red'):
+        self.canvas = canvas
+        self.ax = ax
+        self.bars = ax.containers[0]
+        self.letters = letters
+        self.colors = [color] * len(letters)
+        self.color = color
+        self.highlight_color = highlight_color
+        self.background = None
+        self.extents = []
+        self.frame_times = []
+        self.full_draws = 0
+
+        for bar in self.bars:
+            bar.set_facecolor(color)
+            bar.set_animated(True)
+        # The spines are drawn over the bars, so they are animated too and
+        # drawn again after the bars
+        self.spines = list(ax.spines.values())
+        for spine in self.spines:
+            spine.set_animated(True)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """
+        Cache the background after a full draw and draw the bars on top of it.
+        """
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        # Snapped and antialiased edges reach up to half a pixel past the extent
+        self.extents = [bar.get_window_extent(event.renderer).padded(1) for bar in self.bars]
+        for bar in self.bars:
+            self.ax.draw_artist(bar)
+        for spine in self.spines:
+            self.ax.draw_artist(spine)
+
+    def update(self, counts, highlight_letter=None):
+        """
+        Update the heights and colors of the bars.
+
+        Args:
+            counts (list): The number of names per letter of the alphabet.
+            highlight_letter (str): The letter of the bar drawn in the highlight color.
+        """
+        start = perf_counter()
+        renderer = self.canvas.get_renderer()
+
+        changed = []
+        for idx, (bar, letter, count) in enumerate(zip(self.bars, self.letters, counts)):
+            color = self.highlight_color if letter == highlight_letter else self.color
+            if bar.get_height() != count or self.colors[idx] != color:
+                bar.set_height(count)
+                bar.set_facecolor(color)
+                self.colors[idx] = color
+                changed.append(idx)
+
+        top = max(counts, default=0)
+        low, high = self.ax.get_ylim()
+        if self.background is None or top > high or top < high / 2:
+            self.ax.set_ylim(0, top * 1.05 or 1)
+            self.canvas.draw()
+            self.full_draws += 1
+        elif changed:
+            # A changed bar needs the background restored under its old and
+            # new extent, and every bar touching a restored area has to be
+            # redrawn with the background restored under it too
+            areas = {}
+            for idx in changed:
+                extent = self.bars[idx].get_window_extent(renderer).padded(1)
+                areas[idx] = Bbox.union([self.extents[idx], extent])
+                self.extents[idx] = extent
+            pending = list(areas)
+            while pending:
+                area = areas[pending.pop()]
+                for idx, extent in enumerate(self.extents):
+                    if idx not in areas and extent.overlaps(area):
+                        areas[idx] = extent
+                        pending.append(idx)
+
+            # The saved region counts rows from the top of the figure and its
+            # boxes include their last row and column, so the restored box is
+            # flipped from display coordinates and shrunk by one pixel, and xy
+            # is the corner of the region itself, which restores it in place
+            height = self.canvas.figure.bbox.height
+            origin = self.background.get_extents()[:2]
+            restored = []
+            for area in areas.values():
+                extent = Bbox.intersection(area, self.ax.bbox)
+                if extent is None:
+                    continue
+                x0, y0 = np.floor(extent.p0)
+                x1, y1 = np.ceil(extent.p1)
+                self.canvas.restore_region(self.background, bbox=(x0, height - y1, x1 - 1, height - y0 - 1),
+                                           xy=origin)
+                restored.append(Bbox([[x0, y0], [x1, y1]]))
+            for idx in sorted(areas):
+                self.ax.draw_artist(self.bars[idx])
+            # The spines are only drawn inside the restored areas, everywhere
+            # else they are still on the canvas. The areas may overlap, so they
+            # are split into disjoint boxes to draw each pixel once
+            for spine in self.spines:
+                clip_on, clip_box = spine.get_clip_on(), spine.get_clip_box()
+                spine.set_clip_on(True)
+                for area in self.disjoint_boxes(restored):
+                    spine.set_clip_box(area)
+                    self.ax.draw_artist(spine)
+                spine.set_clip_on(clip_on)
+                spine.set_clip_box(clip_box)
+            if restored:
+                self.canvas.blit(Bbox.union(restored))
+        self.frame_times.append(perf_counter() - start)
+
+    @staticmethod
+    def disjoint_boxes(boxes):
+        """
+        Split the union of pixel-aligned boxes into disjoint boxes.
+
+        Args:
+            boxes (list): Boxes in display coordinates.
+
+        Returns:
+            list: Disjoint boxes covering the same pixels, one or more per vertical slab.
+        """
+        edges = sorted({x for box in boxes for x in (box.x0, box.x1)})
+        disjoint = []
+        for left, right in zip(edges, edges[1:]):
+            spans = sorted((box.y0, box.y1) for box in boxes if box.x0 <= left and right <= box.x1)
+            merged = []
+            for low, high in spans:
+                if merged and low <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], high)
+                else:
+                    merged.append([low, high])
+            disjoint.extend(Bbox([[left, low], [right, high]]) for low, high in merged)
+        return disjoint
+
+    def stats(self):
+        """
+        Summarize the update times.
+
+        Returns:
+            str: The last and the mean update time and the number of full draws.
+        """
+        if not self.frame_times:
+            return 'no updates yet'
+        last = self.frame_times[-1] * 1000
+        mean = sum(self.frame_times) / len(self.frame_times) * 1000
+        return (f'last update: {last:.1f} ms, mean: {mean:.1f} ms over {len(self.frame_times)} updates, '
+                f'full draws: {self.full_draws}')
+
+
 def update_plot():
     """
-    Update the plot based on the filter letter and desired letters.
+    Request the dataset of the desired letters from the worker, the plot is updated when it arrives.
     """
-    global size, alphabet, fig, ax, canvas, alphabet_mapping
+    global size, seed, alphabet, poll_job
 
     filter_letter = validate_filter_letter(filter_entry.get().lower())
     print(f'filter letter: {filter_letter}')
     
     letters = alphabet.copy()
     desired_letter = list(desired_entry.get()) # 'abc'
-    names = generator_names(size=size, desired_letters=desired_letter)
-    m = create_matrix(names=names, alphabet=alphabet)
+    try:
+        size = int(size_entry.get())
+        if size < 1:
+            raise ValueError(size)
+    except ValueError:
+        messagebox.showerror("Error", "Invalid size!")
+        return
 
     if filter_letter in letters and desired_letter:
-        col_index = alphabet_mapping[filter_letter]
-        filtered_names = m[col_index]
+        worker.submit(size, desired_letter, seed, payload=filter_letter)
+        progress_bar.config(maximum=size, value=0)
+        status_label.config(text=f'Generating {size} names...')
+        if poll_job is None:
+            poll_job = root.after(50, poll_results)
+    else:
+        messagebox.showerror("Error", "Invalid filter letter!")
 
-        ax.clear()
-        ax.bar(letters, [len(names) for names in m])
-        ax.bar(filter_letter, len(filtered_names), color='red')
-        ax.set_xlabel('Letters')
-        ax.set_ylabel('Count')
-        ax.set_title('Name Distribution by First Letter')
 
-        canvas.draw()
+def poll_results():
+    """
+    Handle the messages of the worker, ignoring those of stale requests.
+    """
+    global buckets, poll_job
+
+    waiting = True
+    try:
+        while True:
+            message = worker.results.get_nowait()
+            if message[1] != worker.latest:
+                continue
+            if message[0] == 'progress':
+                progress_bar.config(value=message[2])
+            elif message[0] == 'done':
+                waiting = False
+                buckets = message[2]
+                show_filtered_names(message[3])
+            elif message[0] == 'error':
+                waiting = False
+                status_label.config(text='')
+                messagebox.showerror("Error", str(message[2]))
+    except queue.Empty:
+        pass
+
+    poll_job = root.after(50, poll_results) if waiting else None
+
+
+def show_filtered_names(filter_letter):
+    """
+    Plot the current dataset with the filtered bar highlighted and list the filtered names.
 
-        messagebox.showinfo("Filtered Names", "\n".join(filtered_names))
-    else:
-        messagebox.showerror("Error", "Invalid filter letter!")
+    Args:
+        filter_letter (str): The letter of the filtered names.
+    """
+    filtered_names = buckets.bucket(filter_letter)
+
+    progress_bar.config(value=progress_bar.cget('maximum'))
+    status_label.config(text=f'{len(buckets)} names')
+    bar_plot.update(buckets.counts(), filter_letter)
+    frame_label.config(text=bar_plot.stats())
+    cache_label.config(text=f'dataset cache: {dataset_cache.stats()}')
+
+    shown = "\n".join(filtered_names[:shown_names_limit])
+    if len(filtered_names) > shown_names_limit:
+        shown += f"\n... and {len(filtered_names) - shown_names_limit} more"
+    messagebox.showinfo("Filtered Names", shown)
 
 
 def get_random_name():
     """
     Get a random name from the generated names.
     """
-    random_name = choice(names)
+    random_name = buckets.random_name()
+    if random_name is None:
+        messagebox.showerror("Error", "No names generated!")
+        return
     messagebox.showinfo("Random Name", random_name)
 
 
@@ -142,10 +653,14 @@ def validate_filter_letter(choisen_letter: str):
 
 # initialization
 size = 10 ** 4
+seed = 0
 desired_letters = 'v d e'.split()
-names = generator_names(size, desired_letters=desired_letters)
 alphabet = [chr(n).lower() for n in range(ord('a'), ord('z') + 1)]
-m = create_matrix(names=names, alphabet=alphabet)
+shown_names_limit = 100
+dataset_cache = DatasetCache(alphabet)
+buckets = dataset_cache.get(size, desired_letters, seed)
+worker = GenerationWorker(dataset_cache)
+poll_job = None
 
 # create the gui
 root = tk.Tk()
@@ -165,16 +680,36 @@ desired_label.pack()
 desired_entry = tk.Entry(root)
 desired_entry.pack()
 
+size_label = tk.Label(root, text='Size:')
+size_label.pack()
+
+size_entry = tk.Entry(root)
+size_entry.insert(0, str(size))
+size_entry.pack()
+
 # visualisation
 # fig, ax = plot_name_distribution(letters, m)
-fig, ax = plot_name_distribution(alphabet, m)
+fig, ax = plot_name_distribution(alphabet, buckets)
 canvas = FigureCanvasTkAgg(fig, master=root)
+bar_plot = BarPlot(canvas, ax, alphabet)
 canvas.draw()
 canvas.get_tk_widget().pack()
 
+frame_label = tk.Label(root, text=bar_plot.stats())
+frame_label.pack()
+
+cache_label = tk.Label(root, text=f'dataset cache: {dataset_cache.stats()}')
+cache_label.pack()
+
 update_button = tk.Button(root, text="Update", command=update_plot)
 update_button.pack()
 
+progress_bar = ttk.Progressbar(root, length=200, maximum=size, value=size)
+progress_bar.pack()
+
+status_label = tk.Label(root, text=f'{len(buckets)} names')
+status_label.pack()
+
 instructions_label = tk.Label(root, text="Enter a letter and click 'Update' to filter names.\n"
                                           "Click 'Random Name' to get a random name.")
 instructions_label.pack()
@@ -1,10 +1,21 @@
+import heapq
+import mmap
+import os
+import time
 import tkinter as tk
 from tkinter import messagebox
-from random import randint
+from random import randint, Random
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, islice
 from PIL import Image, ImageTk
 
 
 class WordGenerator:
+    # Maps the byte values 0..25 onto 'a'..'z'
+    _LETTERS = bytes(range(ord('a'), ord('z') + 1)).ljust(256, b'?')
+
     @staticmethod
     def generate_random_word():
         """
@@ -22,8 +33,63 @@ class WordGenerator:
             r_word += r_n
         return r_word
 
+    @staticmethod
+    def generate_random_words(count, seed=None, min_size=6, max_size=10):
+        """
+        Generate many random words of lowercase alphabets at once.
+
+        Letters and lengths are drawn as random bytes from one seeded random.Random and mapped onto the
+        alphabet with bytes.translate, so there is no Python call per character. The same seed always
+        gives the same words.
+
+        Args:
+            count (int): Number of words.
+            seed (int): Seed of the random source, a random seed when not given.
+            min_size (int): Minimal word length.
+            max_size (int): Maximal word length.
+
+        Returns:
+            list: Randomly generated words.
+        """
+        rng = Random(seed)
+        sizes = WordGenerator._random_values(rng, count, max_size - min_size + 1)
+        offsets = list(accumulate((size + min_size for size in sizes), initial=0))
+        letters = WordGenerator._random_values(rng, offsets[-1], 26).translate(WordGenerator._LETTERS)
+        text = letters.decode('ascii')
+        return [text[offsets[n]:offsets[n + 1]] for n in range(count)]
+
+    @staticmethod
+    def _random_values(rng, count, span):
+        """
+        Draw count uniform values in [0, span) as bytes.
+
+        Bytes above the largest multiple of span are rejected so every value is equally likely.
+        """
+        limit = 256 - 256 % span
+        table = bytes(n % span for n in range(256))
+        reject = bytes(range(limit, 256))
+        values = b''
+        while len(values) < count:
+            needed = count - len(values)
+            values += rng.randbytes(needed + needed // 8 + 16).translate(table, reject)
+        return values[:count]
+
 
 class WordAnalyzer:
+    # Registered strategies, name -> function(word) returning the maximal length
+    strategies = {}
+
+    @classmethod
+    def register(cls, name, strategy):
+        """
+        Register a strategy for the longest substring without repeating characters.
+
+        Args:
+            name (str): Name shown in the comparison.
+            strategy (callable): Function taking a word and returning the maximal length.
+        """
+        cls.strategies[name] = strategy
+
     @staticmethod
     def get_max_size(word):
         """
@@ -35,17 +101,852 @@ class WordAnalyzer:
         Returns:
             int: Length of the longest substring without repeating characters.
         """
+        return WordAnalyzer.get_max_window(word)[0]
+
+    @staticmethod
+    def get_max_window(word):
+        """
+        Find the longest substring without repeating characters in the given word.
+
+        Args:
+            word (str): Input word.
+
+        Returns:
+            tuple: Length, start offset and end offset (exclusive) of the first longest substring.
+        """
         max_size = 0
+        max_start = 0
         temp_map = {}
         start = 0
         for end, n in enumerate(word):
             if n in temp_map and temp_map[n] >= start:
                 start = temp_map[n] + 1
             temp_map[n] = end
+            if end - start + 1 > max_size:
+                max_size = end - start + 1
+                max_start = start
+        return max_size, max_start, max_start + max_size
+
+    @staticmethod
+    def get_max_size_array(word):
+        """
+        Sliding window with a fixed last-seen array instead of a dict.
+
+        Args:
+            word (str): Input word.
+
+        Returns:
+            int: Length of the longest substring without repeating characters.
+        """
+        try:
+            codes = word.encode('latin-1')
+        except UnicodeEncodeError:
+            return WordAnalyzer.get_max_size(word)
+        max_size = 0
+        last_seen = [-1] * 256
+        start = 0
+        for end, n in enumerate(codes):
+            if last_seen[n] >= start:
+                start = last_seen[n] + 1
+            last_seen[n] = end
             if end - start + 1 > max_size:
                 max_size = end - start + 1
         return max_size
 
+    @staticmethod
+    def get_max_size_bitmask(word):
+        """
+        Sliding window that keeps the window's characters as bits of one integer, for ASCII words.
+
+        Args:
+            word (str): Input word.
+
+        Returns:
+            int: Length of the longest substring without repeating characters.
+        """
+        if not word.isascii():
+            return WordAnalyzer.get_max_size(word)
+        codes = word.encode('ascii')
+        max_size = 0
+        window = 0
+        start = 0
+        for end, n in enumerate(codes):
+            bit = 1 << n
+            while window & bit:
+                window &= ~(1 << codes[start])
+                start += 1
+            window |= bit
+            if end - start + 1 > max_size:
+                max_size = end - start + 1
+        return max_size
+
+    @staticmethod
+    def get_max_size_brute(word):
+        """
+        Reference implementation: grow a window from every start until a character repeats.
+
+        Args:
+            word (str): Input word.
+
+        Returns:
+            int: Length of the longest substring without repeating characters.
+        """
+        max_size = 0
+        for start in range(len(word)):
+            seen = set()
+            for n in word[start:]:
+                if n in seen:
+                    break
+                seen.add(n)
+            max_size = max(max_size, len(seen))
+        return max_size
+
+    @staticmethod
+    def compare_strategies(words, reference='brute force'):
+        """
+        Run words through every registered strategy, timing each and checking it against the reference.
+
+        Args:
+            words (list): Words to analyze.
+            reference (str): Name of the strategy whose results are taken as correct.
+
+        Returns:
+            list: One dict per strategy with its name, seconds, and whether it agrees with the reference.
+        """
+        results = {}
+        report = []
+        for name, strategy in WordAnalyzer.strategies.items():
+            started = time.perf_counter()
+            results[name] = [strategy(word) for word in words]
+            report.append({'name': name, 'seconds': time.perf_counter() - started})
+        for row in report:
+            row['agrees'] = results[row['name']] == results[reference]
+        return report
+
+    @staticmethod
+    def get_max_sizes(words, processes=None, chunk_size=10000):
+        """
+        Analyze many words at once.
+
+        Words are scanned with one last-seen array of 256 positions that is reused for every word:
+        positions are absolute over the whole batch, so the array never has to be cleared.
+        Words with characters outside Latin-1 fall back to get_max_window.
+
+        Args:
+            words (iterable): Words to analyze, e.g. a list, a generator or WordAnalyzer.read_words(path).
+            processes (int): Number of worker processes, the words are analyzed in this process when not given.
+            chunk_size (int): Number of words sent to a worker at a time.
+
+        Returns:
+            tuple: Lengths, start offsets and end offsets as array('I'), in the order of the words.
+        """
+        if not processes or processes < 2:
+            return WordAnalyzer._analyze_chunk(words)
+
+        lengths, starts, ends = array('I'), array('I'), array('I')
+
+        def collect(future):
+            chunk_lengths, chunk_starts, chunk_ends = future.result()
+            lengths.extend(chunk_lengths)
+            starts.extend(chunk_starts)
+            ends.extend(chunk_ends)
+
+        # At most two chunks per process are in flight, so the words are
+        # still read lazily and the results are collected in order
+        words = iter(words)
+        chunks = iter(lambda: list(islice(words, chunk_size)), [])
+        pending = deque()
+        with ProcessPoolExecutor(processes) as executor:
+            for chunk in chunks:
+                if len(pending) >= 2 * processes:
+                    collect(pending.popleft())
+                pending.append(executor.submit(WordAnalyzer._analyze_chunk, chunk))
+            while pending:
+                collect(pending.popleft())
+        return lengths, starts, ends
+
+    @staticmethod
+    def _analyze_chunk(words):
+        lengths, starts, ends = array('I'), array('I'), array('I')
+        last_seen = [-1] * 256
+        base = 0
+        for word in words:
+            try:
+                codes = word.encode('latin-1')
+            except UnicodeEncodeError:
+                max_size, max_start, max_end = WordAnalyzer.get_max_window(word)
+            else:
+                max_size = 0
+                max_start = start = base
+                for end, n in enumerate(codes, base):
+                    if last_seen[n] >= start:
+                        start = last_seen[n] + 1
+                    last_seen[n] = end
+                    if end - start + 1 > max_size:
+                        max_size = end - start + 1
+                        max_start = start
+                max_start -= base
+                max_end = max_start + max_size
+                base += len(codes)
+            lengths.append(max_size)
+            starts.append(max_start)
+            ends.append(max_end)
+        return lengths, starts, ends
+
+    @staticmethod
+    def get_max_window_file(path, chunk_size=1 << 24):
+        """
+        Find the longest substring without repeating bytes in a file of any size.
+
+        The file is memory-mapped and scanned chunk by chunk. The sliding window state (window start and
+        last-seen positions) is carried across chunk boundaries, so memory stays at one chunk whatever the
+        file size. Text files are analyzed byte by byte.
+
+        Args:
+            path (str): Path to a text or binary file.
+            chunk_size (int): Number of bytes read from the mapping at a time.
+
+        Returns:
+            tuple: Length, absolute start offset and absolute end offset (exclusive) of the first longest substring.
+        """
+        max_size = 0
+        max_start = 0
+        last_seen = [-1] * 256
+        start = 0
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if not size:
+                return 0, 0, 0
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, size, chunk_size):
+                    for end, n in enumerate(mapped[offset:offset + chunk_size], offset):
+                        if last_seen[n] >= start:
+                            start = last_seen[n] + 1
+                        last_seen[n] = end
+                        if end - start + 1 > max_size:
+                            max_size = end - start + 1
+                            max_start = start
+                    # No window can be longer than the 256 distinct byte values
+                    if max_size == 256:
+                        break
+        return max_size, max_start, max_start + max_size
+
+    @staticmethod
+    def read_words(path):
+        """
+        Read words from a text file, one word per line.
+
+        Args:
+            path (str): Path to the file.
+
+        Yields:
+            str: Words without the line endings, empty lines are skipped.
+        """
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                word = line.rstrip('\r\n')
+                if word:
+                    yield word
+
+
+WordAnalyzer.register('sliding window (dict)', WordAnalyzer.get_max_size)
+WordAnalyzer.register('sliding window (array)', WordAnalyzer.get_max_size_array)
+WordAnalyzer.register('bitmask (ASCII)', WordAnalyzer.get_max_size_bitmask)
+WordAnalyzer.register('brute force', WordAnalyzer.get_max_size_brute)
+
+
+class EditableWord:
+    def __init__(self, word=""):
+        """
+        EditableWord keeps the longest substring without repeating characters of a word up to date while the
+        word is edited.
+
+        For every position the length of the longest unique window ending there is stored. A window is never
+        longer than the number of distinct characters, so an edit only changes the windows around it and is
+        re-scanned locally instead of from the start of the word. Appends reuse the sliding window state of
+        the word's tail and cost amortized O(1). The position of the first longest window is kept up to date
+        from the re-scanned range, the word is only searched again when the longest window gets shorter.
+
+        Args:
+            word (str): Initial word.
+
+        Attributes:
+            chars (list): Characters of the word.
+            ends (list): Length of the longest unique window ending at each position.
+            counts (Counter): Number of positions for each window length.
+            letters (Counter): Number of occurrences of each character.
+        """
+        self.chars = []
+        self.ends = []
+        self.counts = Counter()
+        self.letters = Counter()
+        self.max_size = 0
+        self._first = 0
+        self._tail = None
+        self.splice(0, 0, word)
+
+    @property
+    def text(self):
+        """
+        str: Current word.
+        """
+        return ''.join(self.chars)
+
+    def window(self):
+        """
+        Get the first longest substring without repeating characters.
+
+        Returns:
+            tuple: Length, start offset and end offset (exclusive), as WordAnalyzer.get_max_window.
+        """
+        if not self.max_size:
+            return 0, 0, 0
+        end = self._first + 1
+        return self.max_size, end - self.max_size, end
+
+    def append(self, char):
+        """
+        Append one character to the word.
+
+        Args:
+            char (str): Character to append.
+        """
+        end = len(self.chars)
+        if self._tail is None:
+            # Rebuild the sliding window of the tail once after an edit elsewhere
+            start = end - self.ends[-1] if self.ends else 0
+            self._tail = [start, {self.chars[p]: p for p in range(start, end)}]
+        start, last_seen = self._tail
+        if last_seen.get(char, -1) >= start:
+            start = last_seen[char] + 1
+        last_seen[char] = end
+        self._tail[0] = start
+
+        self.chars.append(char)
+        self.letters[char] += 1
+        self.ends.append(end - start + 1)
+        if end - start + 1 > self.max_size:
+            self._first = end
+        self._count(end - start + 1, 1)
+
+    def splice(self, start, stop, text=""):
+        """
+        Replace the characters in [start, stop) with text, i.e. insert, delete or edit.
+
+        Args:
+            start (int): First replaced position.
+            stop (int): Position after the last replaced character, equal to start for an insert.
+            text (str): New characters, empty for a delete.
+        """
+        if start == stop == len(self.chars):
+            for char in text:
+                self.append(char)
+            return
+        self._tail = None
+        old_max, old_first = self.max_size, self._first
+        shift = len(text) - (stop - start)
+
+        for p in range(start, stop):
+            self.letters[self.chars[p]] -= 1
+            if not self.letters[self.chars[p]]:
+                del self.letters[self.chars[p]]
+            self._count(self.ends[p], -1)
+        self.chars[start:stop] = text
+        self.ends[start:stop] = [0] * len(text)
+        self.letters.update(text)
+
+        # Positions after the last changed one keep their window once both the old and the new window
+        # start after it
+        last_changed = start + len(text) - 1
+        new_stop = start + len(text)
+        window_start = scan = max(0, start - len(self.letters))
+        last_seen = {}
+        rescanned = len(self.chars)
+        for p in range(scan, len(self.chars)):
+            char = self.chars[p]
+            if last_seen.get(char, -1) >= window_start:
+                window_start = last_seen[char] + 1
+            last_seen[char] = p
+            if p < start:
+                continue
+            if p >= new_stop:
+                if window_start > last_changed and p - self.ends[p] + 1 > last_changed:
+                    rescanned = p
+                    break
+                self._count(self.ends[p], -1)
+            self.ends[p] = p - window_start + 1
+            self._count(self.ends[p], 1)
+        self._first = self._find_first(old_max, old_first, start, stop, shift, rescanned)
+
+    def _find_first(self, old_max, old_first, start, stop, shift, rescanned):
+        # Positions before start keep their window, positions in [start, rescanned) were just written and
+        # the ones after are the old positions from stop on, moved by shift
+        if not self.max_size:
+            return 0
+        if self.max_size < old_max:
+            # The longest window got shorter, the new first one can be anywhere
+            return self.ends.index(self.max_size)
+        if self.max_size == old_max and old_first < start:
+            return old_first
+        try:
+            return self.ends.index(self.max_size, start, rescanned)
+        except ValueError:
+            pass
+        # Only when the first longest window was edited away
+        if old_first >= stop and old_first + shift >= rescanned:
+            return old_first + shift
+        return self.ends.index(self.max_size, rescanned)
+
+    def _count(self, size, delta):
+        self.counts[size] += delta
+        if delta > 0 and size > self.max_size:
+            self.max_size = size
+        elif not self.counts[size]:
+            del self.counts[size]
+            if size == self.max_size:
+                self.max_size = max(self.counts, default=0)
+
+
+class SuffixAutomaton:
+    def __init__(self, words=()):
+        """
+        Suffix automaton of one or more words.
+
+        Every state is a class of substrings with the same end positions. Substring queries walk the
+        transitions, so they take time linear in the pattern, not in the text.
+
+        Args:
+            words (iterable): Words to index, a single word is passed as a one-element list.
+
+        Attributes:
+            words (list): Indexed words.
+            next (list): Transitions of each state, a dict of character -> state.
+            link (list): Suffix link of each state.
+            length (list): Length of the longest substring of each state.
+            first (list): (word index, end position) of the first occurrence of each state.
+            occurrences (list): Number of word prefixes that end in each state.
+            total_occurrences (list): Number of end positions of each state over all words.
+        """
+        self.words = []
+        self.next = [{}]
+        self.link = [-1]
+        self.length = [0]
+        self.first = [(0, -1)]
+        self.occurrences = [0]
+        for word in words:
+            self.add_word(word)
+        self._count_occurrences()
+
+    def add_word(self, word):
+        """
+        Add a word to the automaton. Words added after construction need a call to _count_occurrences
+        before count and longest_repeated see them.
+
+        Args:
+            word (str): Word to add.
+        """
+        index = len(self.words)
+        self.words.append(word)
+        last = 0
+        for pos, char in enumerate(word):
+            last = self._extend(last, char, (index, pos))
+            self.occurrences[last] += 1
+
+    def _new_state(self, length, link=-1, transitions=None, first=(0, -1)):
+        self.next.append(dict(transitions or {}))
+        self.link.append(link)
+        self.length.append(length)
+        self.first.append(first)
+        self.occurrences.append(0)
+        return len(self.length) - 1
+
+    def _split(self, p, char, q):
+        # Clone q so that the clone holds the substrings of length up to length[p] + 1
+        clone = self._new_state(self.length[p] + 1, self.link[q], self.next[q], self.first[q])
+        while p != -1 and self.next[p].get(char) == q:
+            self.next[p][char] = clone
+            p = self.link[p]
+        self.link[q] = clone
+        return clone
+
+    def _extend(self, last, char, first):
+        if char in self.next[last]:
+            # The prefix already exists because of an earlier word
+            q = self.next[last][char]
+            if self.length[last] + 1 == self.length[q]:
+                return q
+            return self._split(last, char, q)
+
+        cur = self._new_state(self.length[last] + 1, first=first)
+        p = last
+        while p != -1 and char not in self.next[p]:
+            self.next[p][char] = cur
+            p = self.link[p]
+        if p == -1:
+            self.link[cur] = 0
+        else:
+            q = self.next[p][char]
+            if self.length[p] + 1 == self.length[q]:
+                self.link[cur] = q
+            else:
+                self.link[cur] = self._split(p, char, q)
+        return cur
+
+    def _count_occurrences(self):
+        # The end positions of a state are also end positions of its suffix link
+        self.total_occurrences = list(self.occurrences)
+        for state in sorted(range(1, len(self.length)), key=self.length.__getitem__, reverse=True):
+            self.total_occurrences[self.link[state]] += self.total_occurrences[state]
+
+    def _find(self, pattern):
+        state = 0
+        for char in pattern:
+            state = self.next[state].get(char)
+            if state is None:
+                return None
+        return state
+
+    def contains(self, pattern):
+        """
+        Check whether a pattern occurs in any indexed word.
+
+        Args:
+            pattern (str): Substring to look for.
+
+        Returns:
+            bool: True if the pattern occurs.
+        """
+        return self._find(pattern) is not None
+
+    def count(self, pattern):
+        """
+        Count the occurrences of a pattern over all indexed words.
+
+        Args:
+            pattern (str): Non-empty substring to count.
+
+        Returns:
+            int: Number of occurrences.
+        """
+        state = self._find(pattern)
+        return self.total_occurrences[state] if state else 0
+
+    def distinct_substrings(self):
+        """
+        Count the distinct non-empty substrings of the indexed words.
+
+        Returns:
+            int: Number of distinct substrings.
+        """
+        return sum(self.length[state] - self.length[self.link[state]] for state in range(1, len(self.length)))
+
+    def longest_repeated(self):
+        """
+        Find the longest substring that occurs at least twice.
+
+        Returns:
+            str: Longest repeated substring, empty if no character repeats.
+        """
+        best = max((state for state in range(1, len(self.length)) if self.total_occurrences[state] >= 2),
+                   key=self.length.__getitem__, default=None)
+        if best is None:
+            return ""
+        index, end = self.first[best]
+        return self.words[index][end - self.length[best] + 1:end + 1]
+
+
+class SubstringIndex:
+    def __init__(self, words):
+        """
+        Substring queries over a generated word set, reused across toggle clicks.
+
+        The set-level structures are built the first time a query needs them, so creating the index
+        for a new word set costs nothing until then.
+
+        Args:
+            words (list): Word set to index.
+
+        Attributes:
+            words (list): Indexed words.
+        """
+        self.words = list(words)
+        self._automaton = None
+        self._windows = None
+        self._word_stats = {}
+
+    @property
+    def automaton(self):
+        """
+        SuffixAutomaton: Automaton of the whole word set, built on first use.
+        """
+        if self._automaton is None:
+            self._automaton = SuffixAutomaton(self.words)
+        return self._automaton
+
+    @property
+    def windows(self):
+        """
+        list: (length, word index, start) of every maximal window without repeating characters, built on first use.
+        """
+        if self._windows is None:
+            self._windows = []
+            for index, word in enumerate(self.words):
+                self._windows.extend((length, index, start) for length, start in self._maximal_windows(word))
+        return self._windows
+
+    @staticmethod
+    def _maximal_windows(word):
+        # The window ending at a position is maximal when the next position cannot extend it
+        temp_map = {}
+        start = 0
+        previous = None
+        for end, n in enumerate(word):
+            if n in temp_map and temp_map[n] >= start:
+                if previous is not None:
+                    yield previous
+                start = temp_map[n] + 1
+            temp_map[n] = end
+            previous = (end - start + 1, start)
+        if previous is not None:
+            yield previous
+
+    def top_windows(self, k):
+        """
+        Get the k longest windows without repeating characters over the word set.
+
+        Args:
+            k (int): Number of windows.
+
+        Returns:
+            list: (window, word) pairs, longest first.
+        """
+        windows = heapq.nlargest(k, self.windows, key=lambda window: window[0])
+        return [(self.words[index][start:start + length], self.words[index]) for length, index, start in windows]
+
+    def word_stats(self, word):
+        """
+        Get the substring statistics of one word, computed once per word.
+
+        Args:
+            word (str): Word to describe.
+
+        Returns:
+            dict: Number of distinct substrings and longest repeated substring.
+        """
+        if word not in self._word_stats:
+            automaton = SuffixAutomaton([word])
+            self._word_stats[word] = {
+                'distinct': automaton.distinct_substrings(),
+                'repeated': automaton.longest_repeated(),
+            }
+        return self._word_stats[word]
+
+
+class WidgetRenderer:
+    def __init__(self, master):
+        """
+        Render layer that remembers the last options pushed to each widget.
+
+        Option changes are compared with that state, only the changed ones are kept, and all of them are sent
+        in one configure call per widget from a single idle callback. Setting a value twice before the flush,
+        or setting the value a widget already has, costs no Tcl call. The layer has no dependency on WordApp
+        and can drive any Tk widget or variable, e.g. another app's result label.
+
+        Args:
+            master (tkinter.Misc): Widget used to schedule the idle callback.
+
+        Attributes:
+            requested (int): Number of option updates asked for.
+            sent (int): Number of Tcl calls made to apply them.
+            frames (int): Number of idle callbacks that flushed changes.
+        """
+        self.master = master
+        self.state = {}
+        self.pending = {}
+        self.scheduled = None
+        self.requested = 0
+        self.sent = 0
+        self.frames = 0
+
+    @property
+    def saved(self):
+        """
+        int: Number of Tcl calls saved compared to one call per option update.
+        """
+        return self.requested - self.sent
+
+    def configure(self, widget, **options):
+        """
+        Ask for widget options to be changed at the next idle callback.
+
+        Args:
+            widget (tkinter.Widget): Widget to configure.
+            **options: Widget options, as for widget.configure.
+        """
+        # Widgets and variables are keyed by their Tk name, tk.Variable is not hashable
+        last = self.state.setdefault(str(widget), {})
+        pending = self.pending.setdefault(str(widget), (widget, {}))[1]
+        for key, value in options.items():
+            self.requested += 1
+            if key in last and last[key] == value:
+                pending.pop(key, None)
+            else:
+                pending[key] = value
+        if pending and self.scheduled is None:
+            self.scheduled = self.master.after_idle(self.flush)
+
+    def set(self, variable, value):
+        """
+        Ask for a Tk variable to be set at the next idle callback.
+
+        Args:
+            variable (tkinter.Variable): Variable to set.
+            value: New value.
+        """
+        self.configure(variable, value=value)
+
+    def flush(self):
+        """
+        Send the pending changes, one Tcl call per changed widget.
+        """
+        self.scheduled = None
+        pending, self.pending = self.pending, {}
+        sent = self.sent
+        for name, (widget, options) in pending.items():
+            if not options:
+                continue
+            if isinstance(widget, tk.Variable):
+                widget.set(options['value'])
+            else:
+                widget.configure(**options)
+            self.state[name].update(options)
+            self.sent += 1
+        if self.sent > sent:
+            self.frames += 1
+
+
+class VirtualWordGrid:
+    def __init__(self, master, words, images, rows=10, command=None, renderer=None):
+        """
+        Scrollable list of words that only creates widgets for the visible rows.
+
+        A fixed pool of rows (a checkbutton and an image label each) is re-bound to other words when the list
+        is scrolled, so startup, scrolling and selecting cost the same whatever the number of words.
+        The selection is a single index.
+
+        Args:
+            master (tkinter.Widget): Parent widget.
+            words (list): Words to display.
+            images (list): PhotoImage objects for the labels, indexed by image_index.
+            rows (int): Number of visible rows.
+            command (callable): Called with the selected index, or None when the selection is cleared.
+            renderer (WidgetRenderer): Render layer for the row updates, one is created when not given.
+
+        Attributes:
+            first (int): Index of the word in the top visible row.
+            selected (int): Index of the selected word, or None.
+            show_words (bool): Whether the labels show their word.
+            image_index (int): Index of the image shown by the labels.
+        """
+        self.words = words
+        self.images = images
+        self.rows = min(rows, len(words)) or 1
+        self.command = command
+        self.renderer = renderer or WidgetRenderer(master)
+        self.first = 0
+        self.selected = None
+        self.show_words = True
+        self.image_index = 1
+
+        self.frame = tk.Frame(master)
+        self.scrollbar = tk.Scrollbar(self.frame, orient='vertical', command=self.yview)
+        self.scrollbar.grid(row=0, column=2, rowspan=self.rows, sticky='ns')
+
+        self.row_vars = []
+        self.row_toggles = []
+        self.row_labels = []
+        for r in range(self.rows):
+            toggle_var = tk.BooleanVar(value=False)
+            toggle = tk.Checkbutton(self.frame, variable=toggle_var, width=12, anchor='w',
+                                    command=lambda r=r: self.toggle(r))
+            toggle.grid(row=r, column=0, padx=5, pady=5, sticky="w")
+
+            label = tk.Label(self.frame, text="", width=200, height=35, relief='ridge')
+            label.configure(font=('Arial', 8, 'bold'), bg='#f5f5f5', fg='black', borderwidth=2, compound='center')
+            label.grid(row=r, column=1)
+
+            for widget in (toggle, label):
+                widget.bind('<MouseWheel>', lambda event: self.yview('scroll', -1 if event.delta > 0 else 1, 'units'))
+                widget.bind('<Button-4>', lambda event: self.yview('scroll', -1, 'units'))
+                widget.bind('<Button-5>', lambda event: self.yview('scroll', 1, 'units'))
+
+            self.row_vars.append(toggle_var)
+            self.row_toggles.append(toggle)
+            self.row_labels.append(label)
+
+        self.render()
+
+    def grid(self, **kwargs):
+        """
+        Place the grid in its parent with the grid geometry manager.
+        """
+        self.frame.grid(**kwargs)
+
+    def yview(self, *args):
+        """
+        Scroll the list, called by the scrollbar and the mouse wheel.
+
+        Args:
+            *args: ('moveto', fraction) or ('scroll', count, 'units' or 'pages').
+        """
+        if args[0] == 'moveto':
+            first = round(float(args[1]) * len(self.words))
+        else:
+            step = self.rows if args[2] == 'pages' else 1
+            first = self.first + int(args[1]) * step
+        first = max(0, min(first, len(self.words) - self.rows))
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def toggle(self, r):
+        """
+        Select or unselect the word of a visible row.
+
+        Args:
+            r (int): Visible row that was clicked.
+        """
+        index = self.first + r
+        self.selected = index if self.row_vars[r].get() else None
+        self.render()
+        if self.command:
+            self.command(self.selected)
+
+    def set_labels(self, show_words, image_index):
+        """
+        Change what the labels show, only the visible rows are updated.
+
+        Args:
+            show_words (bool): Whether the labels show their word.
+            image_index (int): Index of the image shown by the labels.
+        """
+        self.show_words = show_words
+        self.image_index = image_index
+        self.render()
+
+    def render(self):
+        """
+        Bind the visible rows to the words from first on.
+        """
+        image = self.images[self.image_index]
+        for r in range(self.rows):
+            index = self.first + r
+            word = self.words[index]
+            self.renderer.configure(self.row_toggles[r], text=word)
+            self.renderer.set(self.row_vars[r], index == self.selected)
+            self.renderer.configure(self.row_labels[r], text=word if self.show_words else "", image=image)
+        self.scrollbar.set(self.first / len(self.words), (self.first + self.rows) / len(self.words))
+
 
 class WordApp:
     def __init__(self, master, size):
@@ -59,19 +960,23 @@ class WordApp:
         Attributes:
             size (int): Number of words to generate and display.
             words (list): List of randomly generated words.
-            word_toggles (list): List of toggle variables for checkbuttons.
-            word_labels (list): List of labels displaying words.
+            word_grid (VirtualWordGrid): Scrollable grid of checkbuttons and labels for the words.
             master (tkinter.Tk): Root window of the application.
+            renderer (WidgetRenderer): Render layer for the word grid and the result labels.
             label_images (list): List to hold PhotoImage objects for labels.
             idx (int): Index to keep track of the current image in label_images.
+            editable_word (EditableWord): Selected word as it is edited in the result pane.
+            substring_index (SubstringIndex): Substring index of the words, its set-level structures are built on first query.
         """
         self.size = size
         self.words = []
-        self.word_toggles = []
-        self.word_labels = []
+        self.word_grid = None
         self.master = master
+        self.renderer = WidgetRenderer(master)
         self.label_images = []
         self.idx = 1
+        self.editable_word = None
+        self.substring_index = None
         self.build_gui()
 
 
@@ -85,71 +990,48 @@ class WordApp:
         self.master.title('Word App')
         self.master.geometry("750x450")
         self.result_label = tk.Label(self.master, text="Result: ", font=('Arial', 14))
-        self.result_label.grid(row=0, column=2, padx=10, pady=10, rowspan=self.size, sticky='n')
+        self.result_label.grid(row=0, column=2, padx=10, pady=10, rowspan=2, sticky='n')
 
         self.generate_words()
         
         self.g_button = tk.Button(self.master, text='Toggle Words', command=self.label_words)
         self.g_button.grid(row=0, column=0, columnspan=2, padx=10, pady=10)
 
-        self.create_checkbuttons()
-        self.create_labels()
+        self.create_word_grid()
 
         self.clear_labels_button = tk.Button(self.master, text='Clear Labels', command=self.clear_labels)
-        self.clear_labels_button.grid(row=self.size + 1, column=0, columnspan=2, padx=10, pady=10)
+        self.clear_labels_button.grid(row=2, column=0, columnspan=2, padx=10, pady=10)
 
+        self.word_editor = tk.Text(self.master, height=1, width=30, font=('Arial', 14), undo=False)
+        self.word_editor.grid(row=2, column=2, columnspan=2, padx=10, pady=10, sticky='w')
+        self.word_editor.tag_configure('window', background='#ffe08a')
+        # Every insert and delete of the editor goes through edit_word, which gets the edited range from the
+        # command itself and forwards the command to the renamed Tk widget
+        self.word_editor_command = self.word_editor._w + '_orig'
+        self.master.tk.call('rename', self.word_editor._w, self.word_editor_command)
+        self.master.tk.createcommand(self.word_editor._w, self.edit_word)
 
-    def create_checkbuttons(self):
-        """
-        Create checkbuttons for each word and associate them with toggle variables.
+        self.stats_label = tk.Label(self.master, text="", font=('Arial', 10), justify='left')
+        self.stats_label.grid(row=3, column=2, columnspan=2, padx=10, sticky='w')
 
-        This method creates checkbuttons for each word in the words list and associates them with toggle variables.
-        The checkbuttons are displayed in a grid layout, with half of them in the first column and the other half
-        in the second column.
+        self.compare_button = tk.Button(self.master, text='Compare Strategies', command=self.compare_strategies)
+        self.compare_button.grid(row=3, column=0, columnspan=2, padx=10, pady=10)
 
-        Returns:
-            list: List of toggle variables for checkbuttons.
-        """
-        for i in range(self.size):
-            toggle_var = tk.BooleanVar()
-            toggle_var.set(False)
-            toggle = tk.Checkbutton(self.master, text=self.words[i], variable=toggle_var, command=self.toggle_word)
-            # toggle.grid(row=1 + i, column=i % 2, padx=1, pady=1, sticky="w")
-            if i % self.size // (self.size // 2) == 0:
-                toggle.grid(row=1 + i, column=0, padx=5, pady=5, sticky="w")
-            else:
-                toggle.grid(row=1 + i - (self.size // 2), column=1, padx=5, pady=5, sticky="w")
-            self.word_toggles.append(toggle_var)
+        self.compare_label = tk.Label(self.master, text="", font=('Courier', 9), justify='left')
+        self.compare_label.grid(row=4, column=0, columnspan=4, padx=10, sticky='w')
 
 
-    def create_labels(self):
+    def create_word_grid(self):
         """
-        Create labels to display words and configure them with images.
+        Create the scrollable grid of checkbuttons and labels for the words.
 
-        This method creates labels to display words and configures them with images from the label_images list.
-        The labels are displayed in a grid layout, with half of them in the second column and the other half
-        in the third column.
-
-        Returns:
-            list: List of labels displaying words.
+        Only the visible rows get widgets, see VirtualWordGrid, so the number of widgets does not grow
+        with the size attribute.
         """
         self.add_images()
-        for n in range(self.size):
-            label = tk.Label(self.master, text="", width=200, height=35, relief='ridge')
-            label.configure(font=('Arial', 8, 'bold'))
-            label.configure(bg='#f5f5f5')
-            label.configure(fg='black')
-            label.configure(borderwidth=2)
-            label.configure(image=self.label_images[self.idx], compound='center')
-            # label.grid(row=n, column=(n % 2) + 2)
-
-            if n % self.size // (self.size // 2) != 0:
-                label.grid(row=n, column=3)
-            else:
-                label.grid(row=n + (self.size // 2), column=2)
-            self.word_labels.append(label)
-
-        self.master.update_idletasks()
+        self.word_grid = VirtualWordGrid(self.master, self.words, self.label_images, command=self.toggle_word,
+                                         renderer=self.renderer)
+        self.word_grid.grid(row=1, column=0, columnspan=2, padx=5, sticky='nw')
         self.label_words()
 
 
@@ -178,12 +1060,7 @@ class WordApp:
         This method clears the labels by resetting their text and image to the default image from the label_images list.
         """
         self.idx = 0
-        clear_image = self.label_images[self.idx]
-        for label in self.word_labels:
-            label.configure(text="")
-            label.configure(image=clear_image)
-
-        self.master.update_idletasks()
+        self.word_grid.set_labels(show_words=False, image_index=self.idx)
 
 
     def generate_words(self):
@@ -193,7 +1070,8 @@ class WordApp:
         This method generates a random word using the WordGenerator class and stores them in the words list.
         The number of words generated is determined by the size attribute.
         """
-        self.words = [WordGenerator.generate_random_word() for _ in range(self.size)]
+        self.words = WordGenerator.generate_random_words(self.size)
+        self.substring_index = SubstringIndex(self.words)
 
     def label_words(self):
         """
@@ -203,32 +1081,20 @@ class WordApp:
         The labels are also configured with the default image from the label_images list.
         """
         self.idx = 1
-        default_image = self.label_images[self.idx]
-        for idx, word in enumerate(self.words):
-            label = self.word_labels[idx]
-            label.config(text=f"{self.word_toggles[idx]}")
-            label.configure(image=default_image)
+        self.word_grid.set_labels(show_words=True, image_index=self.idx)
 
-        self.master.update_idletasks()
 
-
-    def toggle_word(self):
+    def toggle_word(self, index):
         """
         Toggle the selected word and update the result label.
 
-        This method toggles the selected word by updating the toggle variables of the checkbuttons.
-        It ensures that only one word is selected at a time.
-        The method also calls the slice_word method to analyze the selected word and update the result label accordingly.
+        The word grid keeps a single selected index, so only one word is selected at a time.
+        The method calls the slice_word method to analyze the selected word and update the result label accordingly.
+
+        Args:
+            index (int): Index of the selected word, or None when the word was unselected.
         """
-        selected_word = ""
-        for r in range(self.size):
-            if self.word_toggles[r].get():
-                selected_word = self.words[r]
-                for c in range(self.size):
-                    if r != c:
-                        self.word_toggles[c].set(False)
-                break
-        self.slice_word(selected_word)
+        self.slice_word(self.words[index] if index is not None else "")
 
 
     def slice_word(self, selected_word):
@@ -243,10 +1109,100 @@ class WordApp:
             selected_word (str): Selected word to analyze.
         """
         if selected_word:
-            max_size = WordAnalyzer.get_max_size(selected_word)
-            self.result_label.config(text=f"{selected_word}: {max_size}")
+            self.editable_word = None
+            self.word_editor.delete('1.0', 'end')
+            self.word_editor.insert('1.0', selected_word)
+            self.editable_word = EditableWord(selected_word)
+            self.show_window()
+            stats = self.substring_index.word_stats(selected_word)
+            self.renderer.configure(self.stats_label, text=f"distinct substrings: {stats['distinct']}\n"
+                                                           f"longest repeated: {stats['repeated'] or '-'}")
         else:
-            self.result_label.config(text="")
+            self.editable_word = None
+            self.word_editor.delete('1.0', 'end')
+            self.renderer.configure(self.result_label, text="")
+            self.renderer.configure(self.stats_label, text="")
+
+    def compare_strategies(self):
+        """
+        Time every WordAnalyzer strategy on the selected word, or on all words when none is selected, and show
+        the timings and whether each strategy agrees with the brute force reference.
+        """
+        words = [self.editable_word.text] if self.editable_word is not None else self.words
+        lines = [f"{len(words)} word(s)"]
+        for row in WordAnalyzer.compare_strategies(words):
+            status = 'ok' if row['agrees'] else 'MISMATCH'
+            lines.append(f"{row['name']:<24} {row['seconds'] * 1000:9.3f} ms  {status}")
+        self.renderer.configure(self.compare_label, text="\n".join(lines))
+
+    def edit_word(self, operation, *args):
+        """
+        Run a command of the word editor and apply the edit to the word in the result pane.
+
+        The edited range is taken from the indices and text of an insert, delete or replace command, and only that
+        range is passed to the EditableWord, so the word is not analyzed again from the start.
+
+        Args:
+            operation (str): Text widget command, e.g. 'insert' or 'delete'.
+            *args: Arguments of the command.
+
+        Returns:
+            str: Result of the command, or an empty string when it failed.
+        """
+        call = self.master.tk.call
+        try:
+            if self.editable_word is None or operation not in ('insert', 'delete', 'replace'):
+                return call((self.word_editor_command, operation) + args)
+            if operation == 'insert':
+                start = stop = self.editor_offset(args[0])
+                text = ''.join(args[1::2])
+            else:
+                start = self.editor_offset(args[0])
+                if len(args) > 1 and operation == 'replace':
+                    stop = self.editor_offset(args[1])
+                    text = ''.join(args[2::2])
+                elif len(args) == 2:
+                    stop = self.editor_offset(args[1])
+                    text = ""
+                elif len(args) == 1:
+                    stop = min(start + 1, len(self.editable_word.chars))
+                    text = ""
+                else:
+                    # Several ranges at once are not sent by the Text bindings, analyze the whole text again
+                    result = call((self.word_editor_command, operation) + args)
+                    self.editable_word = EditableWord(call(self.word_editor_command, 'get', '1.0', 'end-1c'))
+                    self.show_window()
+                    return result
+            result = call((self.word_editor_command, operation) + args)
+        except tk.TclError:
+            return ""
+        if stop > start or text:
+            self.editable_word.splice(start, max(start, stop), text)
+            self.show_window()
+        return result
+
+    def editor_offset(self, index):
+        """
+        Convert an index of the word editor to an offset in the edited word.
+
+        Args:
+            index (str): Text widget index, e.g. 'insert' or '1.3'.
+
+        Returns:
+            int: Number of characters before the index, at most the length of the word.
+        """
+        count = self.master.tk.call(self.word_editor_command, 'count', '-chars', '1.0', index)
+        # The index 'end' is after the newline the Text widget always keeps at the end
+        return min(int(count or 0), len(self.editable_word.chars))
+
+    def show_window(self):
+        """
+        Show the longest substring without repeating characters of the edited word and highlight it.
+        """
+        max_size, start, end = self.editable_word.window()
+        self.word_editor.tag_remove('window', '1.0', 'end')
+        self.word_editor.tag_add('window', f'1.0+{start}c', f'1.0+{end}c')
+        self.renderer.configure(self.result_label, text=f"{''.join(self.editable_word.chars[start:end])}: {max_size}")
             
 
     def run(self):